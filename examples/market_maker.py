@@ -60,18 +60,23 @@ import argparse
 import asyncio
 import math
 import os
-import re
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from statistics import stdev
 
-from dotenv import load_dotenv
 import httpx
+from dotenv import load_dotenv
 
-from turbine_client import TurbineClient, TurbineWSClient, Outcome, Side, QuickMarket
+from turbine_client import Outcome, QuickMarket, Side, SignedOrder, TurbineClient, TurbineWSClient
 from turbine_client.exceptions import TurbineApiError, WebSocketError
+from turbine_client.types import Order
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # orjson is optional, stdlib json works too
 
 # Load environment variables
 load_dotenv()
@@ -121,8 +126,12 @@ ONE_SIDE_THRESHOLD = 0.15        # Skip losing side when YES > 0.65 or < 0.35
 END_OF_MARKET_PULL_SECONDS = 30  # Pull all orders in last N seconds
 END_OF_MARKET_WIDEN_SECONDS = 90 # Start widening spread in last N seconds
 
+# Order management
+MAX_CONCURRENT_CANCELS = 8       # Cancel requests in flight at once
+
 # Pyth Network Hermes API
 PYTH_HERMES_URL = "https://hermes.pyth.network/v2/updates/price/latest"
+PYTH_TIMEOUT_SECONDS = 5.0       # Per-request timeout for Hermes price fetches
 PYTH_FEED_IDS = {
     "BTC": "0xe62df6c8b4a85fe1a67db44dc12de5db330f7ac66b72dc658afedf0f4a415b43",
     "ETH": "0xff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace",
@@ -130,6 +139,8 @@ PYTH_FEED_IDS = {
     "XRP": "0xec5d399846a9209f3fe5881d70aae9268c94339ff9817e8d18ff19fa05eea1c8",
     "OIL": "0x925ca92ff005ae943c158e3563f59698ce7e75c5a8c8dd43303a0a154887b3e6",
 }
+# Pyth price scale per exponent, so each poll multiplies instead of calling pow
+_POW10 = {expo: 10.0 ** expo for expo in range(-18, 1)}
 SUPPORTED_ASSETS = list(PYTH_FEED_IDS.keys())
 SUPPORTED_INTERVALS = [15, 60, 1440]
 
@@ -148,6 +159,43 @@ DEFAULT_ASSET_VOLATILITIES: dict[str, float] = {
 }
 
 
+# ============================================================
+# UTILITY: Shared async HTTP client
+# ============================================================
+
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client, creating it on first use.
+
+    Every MarketMaker polls Pyth through this one client, so all of them share
+    a single pool of long-lived HTTP/2 connections. Failed polls are simply
+    retried on the next tick, so the transport does not retry. It is closed
+    once per process, by main(), via close_shared_http_client().
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            timeout=PYTH_TIMEOUT_SECONDS,
+            headers={"Accept-Encoding": "gzip"},
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=0,
+                limits=httpx.Limits(
+                    max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0
+                ),
+            ),
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared async HTTP client if it is open."""
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+
+
 # ============================================================
 # UTILITY: Normal CDF
 # ============================================================
@@ -184,7 +232,7 @@ class PriceTracker:
 
     def add_observation(self, price: float) -> None:
         """Record a new price observation."""
-        now = time.time()
+        now = time.monotonic()
         self.observations.append((price, now))
         # Prune old observations
         cutoff = now - self.max_age
@@ -198,7 +246,7 @@ class PriceTracker:
             return PriceSignals(is_stale=True)
 
         latest_price, latest_time = self.observations[-1]
-        age = time.time() - latest_time
+        age = time.monotonic() - latest_time
         signals = PriceSignals(
             current_price=latest_price,
             observation_age=age,
@@ -249,7 +297,7 @@ class FillRecord:
     outcome: str    # "YES" or "NO"
     price: int
     size: int
-    timestamp: float
+    timestamp: float  # time.monotonic()
 
 
 class InventoryTracker:
@@ -276,7 +324,7 @@ class InventoryTracker:
                 self.no_position -= signed_size
 
         self.recent_fills.append(FillRecord(
-            side=side, outcome=outcome, price=price, size=size, timestamp=time.time()
+            side=side, outcome=outcome, price=price, size=size, timestamp=time.monotonic()
         ))
         self._prune_old_fills()
 
@@ -289,7 +337,7 @@ class InventoryTracker:
 
     def is_adversely_selected(self, threshold: float = ADVERSE_SELECTION_THRESHOLD) -> bool:
         """True if one side is getting filled disproportionately in last 30 seconds."""
-        cutoff = time.time() - 30.0
+        cutoff = time.monotonic() - 30.0
         buy_count = sum(1 for f in self.recent_fills if f.timestamp >= cutoff and f.side == "BUY")
         sell_count = sum(1 for f in self.recent_fills if f.timestamp >= cutoff and f.side == "SELL")
         total = buy_count + sell_count
@@ -305,7 +353,7 @@ class InventoryTracker:
         self.recent_fills.clear()
 
     def _prune_old_fills(self) -> None:
-        cutoff = time.time() - self.fill_max_age
+        cutoff = time.monotonic() - self.fill_max_age
         self.recent_fills = [f for f in self.recent_fills if f.timestamp >= cutoff]
 
 
@@ -351,16 +399,17 @@ def _save_credentials_to_env(env_path: Path, api_key_id: str, api_private_key: s
     env_path = Path(env_path)
 
     if env_path.exists():
-        content = env_path.read_text()
-        if "TURBINE_API_KEY_ID=" in content:
-            content = re.sub(r'^TURBINE_API_KEY_ID=.*$', f'TURBINE_API_KEY_ID={api_key_id}', content, flags=re.MULTILINE)
-        else:
-            content = content.rstrip() + f"\nTURBINE_API_KEY_ID={api_key_id}"
-        if "TURBINE_API_PRIVATE_KEY=" in content:
-            content = re.sub(r'^TURBINE_API_PRIVATE_KEY=.*$', f'TURBINE_API_PRIVATE_KEY={api_private_key}', content, flags=re.MULTILINE)
-        else:
-            content = content.rstrip() + f"\nTURBINE_API_PRIVATE_KEY={api_private_key}"
-        env_path.write_text(content + "\n")
+        # Rewrite the credential lines in one pass and append any that are missing
+        updates = {"TURBINE_API_KEY_ID": api_key_id, "TURBINE_API_PRIVATE_KEY": api_private_key}
+        lines = env_path.read_text().rstrip().splitlines()
+        found = set()
+        for i, line in enumerate(lines):
+            key = line.split("=", 1)[0]
+            if key in updates:
+                lines[i] = f"{key}={updates[key]}"
+                found.add(key)
+        lines.extend(f"{key}={value}" for key, value in updates.items() if key not in found)
+        env_path.write_text("\n".join(lines) + "\n")
     else:
         content = f"# Turbine Bot Config\nTURBINE_PRIVATE_KEY={os.environ.get('TURBINE_PRIVATE_KEY', '')}\nTURBINE_API_KEY_ID={api_key_id}\nTURBINE_API_PRIVATE_KEY={api_private_key}\n"
         env_path.write_text(content)
@@ -389,7 +438,8 @@ class AssetState:
         self.no_target: float = 1.0 - DEFAULT_BASE_PROBABILITY
         self.current_spread: float = DEFAULT_SPREAD
         self.yes_target_at_rebalance: float = DEFAULT_BASE_PROBABILITY
-        self.last_rebalance_time: int = 0
+        # Event loop (monotonic) time; -inf so the first rebalance is never rate-limited
+        self.last_rebalance_time: float = float("-inf")
 
         # Order tracking: order_hash -> {side, outcome, price, size}
         self.active_orders: dict[str, dict] = {}
@@ -400,7 +450,7 @@ class AssetState:
 
         # Circuit breaker
         self.circuit_breaker_tripped: bool = False
-        self.circuit_breaker_until: float = 0.0
+        self.circuit_breaker_until: float = 0.0  # event loop (monotonic) time
 
         # End-of-market
         self.orders_pulled: bool = False
@@ -446,6 +496,9 @@ class MarketMaker:
         self.allocation_usdc = allocation_usdc
         self.base_spread = spread
         self.num_levels = num_levels
+        # Level size weights depend only on num_levels, so compute them once
+        self._buy_weights = self.calculate_geometric_weights(num_levels, "BUY")
+        self._sell_weights = self.calculate_geometric_weights(num_levels, "SELL")
         self.base_volatility = base_volatility
         self.asset_volatilities = asset_volatilities or {}
         self.running = True
@@ -458,8 +511,8 @@ class MarketMaker:
         # Track approved settlement contracts
         self.approved_settlements: dict[str, int] = {}
 
-        # Async HTTP client
-        self._http_client: httpx.AsyncClient | None = None
+        # Bounds concurrent cancels so a full book pull doesn't swamp the API
+        self._cancel_sem = asyncio.Semaphore(MAX_CONCURRENT_CANCELS)
 
     def get_base_volatility_for_asset(self, asset: str) -> float:
         """Get per-asset volatility, falling back to global default."""
@@ -472,13 +525,7 @@ class MarketMaker:
     # ------------------------------------------------------------------
 
     async def _get_http_client(self) -> httpx.AsyncClient:
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=5.0)
-        return self._http_client
-
-    async def close(self) -> None:
-        if self._http_client is not None and not self._http_client.is_closed:
-            await self._http_client.aclose()
+        return get_shared_http_client()
 
     async def get_current_prices(self) -> dict[str, float]:
         """Fetch current prices for all active assets from Pyth Network."""
@@ -490,7 +537,7 @@ class MarketMaker:
                 params=[("ids[]", fid) for fid in feed_ids],
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             prices: dict[str, float] = {}
             if not data.get("parsed"):
@@ -504,7 +551,7 @@ class MarketMaker:
                     price_data = parsed["price"]
                     price_int = int(price_data["price"])
                     expo = price_data["expo"]
-                    prices[asset] = price_int * (10 ** expo)
+                    prices[asset] = price_int * (_POW10.get(expo) or 10.0 ** expo)
 
             return prices
         except Exception as e:
@@ -618,16 +665,19 @@ class MarketMaker:
     def generate_level_prices(self, min_price: float, max_price: float, n: int) -> list[int]:
         """Generate evenly spaced prices clamped to [10000, 990000]."""
         if n <= 1:
-            mid = (min_price + max_price) / 2
-            return [max(10000, min(990000, int(mid * 1_000_000)))]
-        step = (max_price - min_price) / (n - 1)
-        return [max(10000, min(990000, int((min_price + i * step) * 1_000_000))) for i in range(n)]
+            raw = [int((min_price + max_price) / 2 * 1_000_000)]
+        else:
+            step = (max_price - min_price) / (n - 1)
+            raw = [int((min_price + i * step) * 1_000_000) for i in range(n)]
+        # Clamp with comparisons rather than max()/min() calls per level
+        return [10000 if p < 10000 else 990000 if p > 990000 else p for p in raw]
 
     def calculate_shares_from_usdc(self, usdc_amount: float, price: int) -> int:
         """Calculate shares from USDC amount at given price."""
         if price <= 0:
             return 0
-        return int((usdc_amount * 1_000_000 * 1_000_000) / price)
+        # USDC (6 decimals) per price (1e6 scale) -> shares (6 decimals), one multiply
+        return int(usdc_amount * 1_000_000_000_000 / price)
 
     # ------------------------------------------------------------------
     # USDC approval
@@ -635,12 +685,18 @@ class MarketMaker:
 
     MAX_APPROVAL_THRESHOLD = (2**256 - 1) // 2
 
-    def ensure_settlement_approved(self, settlement_address: str) -> None:
-        """Ensure USDC is approved via gasless max permit."""
+    async def ensure_settlement_approved(self, settlement_address: str) -> None:
+        """Ensure USDC is approved via gasless max permit.
+
+        RPC calls run in a worker thread and confirmation polling sleeps on the
+        event loop, so quoting on other assets continues while this waits.
+        """
         if settlement_address in self.approved_settlements:
             return
 
-        current_allowance = self.client.get_usdc_allowance(spender=settlement_address)
+        current_allowance = await asyncio.to_thread(
+            self.client.get_usdc_allowance, spender=settlement_address
+        )
         if current_allowance >= self.MAX_APPROVAL_THRESHOLD:
             print(f"  Existing USDC max approval found")
             self.approved_settlements[settlement_address] = current_allowance
@@ -652,7 +708,7 @@ class MarketMaker:
         print(f"Settlement: {settlement_address}")
 
         try:
-            result = self.client.approve_usdc_for_settlement(settlement_address)
+            result = await asyncio.to_thread(self.client.approve_usdc_for_settlement, settlement_address)
             tx_hash = result.get("tx_hash", "unknown")
             print(f"Relayer TX: {tx_hash}")
             print("Waiting for confirmation...")
@@ -660,14 +716,16 @@ class MarketMaker:
             # Wait for confirmation by polling allowance via API
             for _ in range(30):
                 try:
-                    allowance = self.client.get_usdc_allowance(spender=settlement_address)
+                    allowance = await asyncio.to_thread(
+                        self.client.get_usdc_allowance, spender=settlement_address
+                    )
                     if allowance >= self.MAX_APPROVAL_THRESHOLD:
                         print(f"Max USDC approval confirmed (gasless)")
                         self.approved_settlements[settlement_address] = allowance
                         break
                 except Exception:
                     pass
-                time.sleep(2)
+                await asyncio.sleep(2)
             else:
                 print(f"Approval pending (may still confirm)")
                 self.approved_settlements[settlement_address] = 2**256 - 1
@@ -682,10 +740,35 @@ class MarketMaker:
     # Order management
     # ------------------------------------------------------------------
 
+    async def _cancel_orders(self, orders: list[tuple[str, str, Side]]) -> list[BaseException | None]:
+        """Cancel orders concurrently, at most MAX_CONCURRENT_CANCELS at a time.
+
+        Args:
+            orders: (order_hash, market_id, side) for each order to cancel.
+
+        Returns:
+            One entry per order, in order: None if cancelled, else the exception.
+        """
+        async def cancel(order_hash: str, market_id: str, side: Side) -> None:
+            async with self._cancel_sem:
+                await asyncio.to_thread(
+                    self.client.cancel_order, order_hash, market_id=market_id, side=side
+                )
+
+        return await asyncio.gather(*(cancel(*order) for order in orders), return_exceptions=True)
+
+    async def _cancel_open_orders(self, open_orders: list[Order]) -> list[BaseException | None]:
+        """Cancel orders fetched from the API (see _cancel_orders)."""
+        return await self._cancel_orders(
+            [(o.order_hash, o.market_id, Side(o.side)) for o in open_orders]
+        )
+
     async def cancel_all_orders(self) -> None:
         """Cancel all open orders."""
         try:
-            open_orders = self.client.get_orders(trader=self.client.address, status="open")
+            open_orders = await asyncio.to_thread(
+                self.client.get_orders, trader=self.client.address, status="open"
+            )
         except Exception as e:
             print(f"Failed to fetch open orders: {e}")
             return
@@ -695,13 +778,13 @@ class MarketMaker:
 
         print(f"Cancelling {len(open_orders)} open orders...")
         cancelled = 0
-        for order in open_orders:
-            try:
-                self.client.cancel_order(order.order_hash, market_id=order.market_id, side=Side(order.side))
+        for order, error in zip(open_orders, await self._cancel_open_orders(open_orders)):
+            if error is None:
                 cancelled += 1
-            except TurbineApiError as e:
-                if "404" not in str(e):
-                    print(f"  Failed to cancel {order.order_hash[:10]}...: {e}")
+            elif not isinstance(error, TurbineApiError):
+                raise error
+            elif "404" not in str(error):
+                print(f"  Failed to cancel {order.order_hash[:10]}...: {error}")
         print(f"  Cancelled {cancelled}/{len(open_orders)} orders")
         for state in self.asset_states.values():
             state.active_orders.clear()
@@ -711,17 +794,16 @@ class MarketMaker:
         if not state.market_id:
             return
         try:
-            open_orders = self.client.get_orders(
-                trader=self.client.address, market_id=state.market_id, status="open"
+            open_orders = await asyncio.to_thread(
+                self.client.get_orders,
+                trader=self.client.address, market_id=state.market_id, status="open",
             )
         except Exception:
             return
 
-        for order in open_orders:
-            try:
-                self.client.cancel_order(order.order_hash, market_id=order.market_id, side=Side(order.side))
-            except TurbineApiError:
-                pass
+        for error in await self._cancel_open_orders(open_orders):
+            if error is not None and not isinstance(error, TurbineApiError):
+                raise error
         state.active_orders.clear()
 
     async def place_smart_quotes(self, state: AssetState) -> dict[str, dict]:
@@ -732,6 +814,8 @@ class MarketMaker:
         - Allocate more capital to the likely-winning outcome
         - Skew within each outcome toward sells when probability is high
 
+        Accepted orders are recorded in state.active_orders as they are posted.
+
         Returns:
             Dict of order_hash -> {side, outcome, price, size}
         """
@@ -819,8 +903,8 @@ class MarketMaker:
             no_buy_alloc = 0.0
             no_sell_alloc = 0.0
 
-        buy_weights = self.calculate_geometric_weights(n, "BUY")
-        sell_weights = self.calculate_geometric_weights(n, "SELL")
+        buy_weights = self._buy_weights
+        sell_weights = self._sell_weights
 
         print(
             f"[{state.key}] Quoting: YES {state.yes_target:.1%} / NO {state.no_target:.1%} | "
@@ -829,6 +913,8 @@ class MarketMaker:
         )
 
         # --- PLACE ORDERS ---
+        # Sign every level first, then submit them all concurrently
+        pending: list[tuple[SignedOrder, str, dict]] = []
         for outcome, target, quote_buy, quote_sell, buy_alloc, sell_alloc in [
             (Outcome.YES, state.yes_target, quote_yes_buy, quote_yes_sell, yes_buy_alloc, yes_sell_alloc),
             (Outcome.NO, state.no_target, quote_no_buy, quote_no_sell, no_buy_alloc, no_sell_alloc),
@@ -853,22 +939,18 @@ class MarketMaker:
                     shares = self.calculate_shares_from_usdc(usdc_for_level, price)
                     if shares <= 0:
                         continue
-                    try:
-                        order = self.client.create_limit_buy(
-                            market_id=state.market_id,
-                            outcome=outcome,
-                            price=price,
-                            size=shares,
-                            expiration=expiration,
-                            settlement_address=state.settlement_address,
-                        )
-                        self.client.post_order(order)
-                        new_orders[order.order_hash] = {
-                            "side": "BUY", "outcome": outcome_name,
-                            "price": price, "size": shares
-                        }
-                    except TurbineApiError as e:
-                        print(f"  [{state.key}] Failed {outcome_name} bid L{i}: {e}")
+                    order = self.client.create_limit_buy(
+                        market_id=state.market_id,
+                        outcome=outcome,
+                        price=price,
+                        size=shares,
+                        expiration=expiration,
+                        settlement_address=state.settlement_address,
+                    )
+                    pending.append((order, f"{outcome_name} bid L{i}", {
+                        "side": "BUY", "outcome": outcome_name,
+                        "price": price, "size": shares
+                    }))
 
             # Place asks
             if quote_sell and sell_alloc >= 1.0:
@@ -881,49 +963,82 @@ class MarketMaker:
                     shares = self.calculate_shares_from_usdc(usdc_for_level, price)
                     if shares <= 0:
                         continue
-                    try:
-                        order = self.client.create_limit_sell(
-                            market_id=state.market_id,
-                            outcome=outcome,
-                            price=price,
-                            size=shares,
-                            expiration=expiration,
-                            settlement_address=state.settlement_address,
-                        )
-                        self.client.post_order(order)
-                        new_orders[order.order_hash] = {
-                            "side": "SELL", "outcome": outcome_name,
-                            "price": price, "size": shares
-                        }
-                    except TurbineApiError as e:
-                        print(f"  [{state.key}] Failed {outcome_name} ask L{i}: {e}")
+                    order = self.client.create_limit_sell(
+                        market_id=state.market_id,
+                        outcome=outcome,
+                        price=price,
+                        size=shares,
+                        expiration=expiration,
+                        settlement_address=state.settlement_address,
+                    )
+                    pending.append((order, f"{outcome_name} ask L{i}", {
+                        "side": "SELL", "outcome": outcome_name,
+                        "price": price, "size": shares
+                    }))
+
+        new_orders.update(await self._post_orders(state, pending))
 
         if new_orders:
-            buy_count = sum(1 for o in new_orders.values() if o["side"] == "BUY")
-            sell_count = sum(1 for o in new_orders.values() if o["side"] == "SELL")
+            buy_count = sum(o["side"] == "BUY" for o in new_orders.values())
+            sell_count = len(new_orders) - buy_count
             print(f"  [{state.key}] Placed {buy_count} BUY + {sell_count} SELL ({len(new_orders)} total)")
 
         return new_orders
 
+    async def _post_orders(
+        self, state: AssetState, pending: list[tuple[SignedOrder, str, dict]]
+    ) -> dict[str, dict]:
+        """Submit signed orders concurrently and record the accepted ones.
+
+        Accepted orders are added to state.active_orders before any failure is
+        raised, so orders live on the book are always tracked for cancellation.
+
+        Args:
+            state: The asset the orders belong to.
+            pending: (order, label, info) tuples; label names the order in failure logs.
+
+        Returns:
+            Dict of order_hash -> info for the orders that were accepted.
+
+        Raises:
+            The first non-API error (e.g. a connection failure), after recording.
+        """
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.client.post_order, order) for order, _, _ in pending),
+            return_exceptions=True,
+        )
+        posted: dict[str, dict] = {}
+        for (order, _, info), result in zip(pending, results):
+            if not isinstance(result, BaseException):
+                posted[order.order_hash] = info
+        state.active_orders.update(posted)
+
+        errors = []
+        for (_, label, _), result in zip(pending, results):
+            if isinstance(result, TurbineApiError):
+                print(f"  [{state.key}] Failed {label}: {result}")
+            elif isinstance(result, BaseException):
+                errors.append(result)
+        if errors:
+            raise errors[0]
+        return posted
+
     async def graceful_rebalance(self, state: AssetState) -> None:
         """Place new orders FIRST, then cancel old ones (no gap in liquidity)."""
         old_orders = dict(state.active_orders)
         state.active_orders.clear()
 
         # Place new orders at current fair value
-        new_orders = await self.place_smart_quotes(state)
-        state.active_orders.update(new_orders)
+        await self.place_smart_quotes(state)
 
         # Brief pause for in-flight trades
         await asyncio.sleep(0.2)
 
-        # Cancel old orders
-        for order_hash, info in old_orders.items():
-            try:
-                side = Side.BUY if info["side"] == "BUY" else Side.SELL
-                self.client.cancel_order(order_hash, market_id=state.market_id, side=side)
-            except TurbineApiError:
-                pass  # Order may already be filled or expired
+        # Cancel old orders; failures mean the order was already filled or expired
+        await self._cancel_orders([
+            (order_hash, state.market_id, Side.BUY if info["side"] == "BUY" else Side.SELL)
+            for order_hash, info in old_orders.items()
+        ])
 
     async def check_and_refresh_fills(self, state: AssetState) -> None:
         """Detect filled orders, record in inventory, and replace at CURRENT fair value."""
@@ -964,6 +1079,8 @@ class MarketMaker:
             half_spread = spread / 2
             expiration = int(time.time()) + 300
 
+            # Sign all replacements, then submit them concurrently
+            pending: list[tuple[SignedOrder, str, dict]] = []
             for _, info in filled:
                 # Determine target for this outcome
                 if info["outcome"] == "YES":
@@ -976,41 +1093,35 @@ class MarketMaker:
                 if info["side"] == "BUY":
                     new_price_float = max(0.01, min(0.99, target - half_spread))
                     new_price = int(new_price_float * 1_000_000)
-                    try:
-                        order = self.client.create_limit_buy(
-                            market_id=state.market_id,
-                            outcome=outcome,
-                            price=new_price,
-                            size=info["size"],
-                            expiration=expiration,
-                            settlement_address=state.settlement_address,
-                        )
-                        self.client.post_order(order)
-                        state.active_orders[order.order_hash] = {
-                            "side": "BUY", "outcome": info["outcome"],
-                            "price": new_price, "size": info["size"]
-                        }
-                    except TurbineApiError as e:
-                        print(f"  [{state.key}] Failed to replace BUY: {e}")
+                    order = self.client.create_limit_buy(
+                        market_id=state.market_id,
+                        outcome=outcome,
+                        price=new_price,
+                        size=info["size"],
+                        expiration=expiration,
+                        settlement_address=state.settlement_address,
+                    )
+                    pending.append((order, "to replace BUY", {
+                        "side": "BUY", "outcome": info["outcome"],
+                        "price": new_price, "size": info["size"]
+                    }))
                 else:
                     new_price_float = max(0.01, min(0.99, target + half_spread))
                     new_price = int(new_price_float * 1_000_000)
-                    try:
-                        order = self.client.create_limit_sell(
-                            market_id=state.market_id,
-                            outcome=outcome,
-                            price=new_price,
-                            size=info["size"],
-                            expiration=expiration,
-                            settlement_address=state.settlement_address,
-                        )
-                        self.client.post_order(order)
-                        state.active_orders[order.order_hash] = {
-                            "side": "SELL", "outcome": info["outcome"],
-                            "price": new_price, "size": info["size"]
-                        }
-                    except TurbineApiError as e:
-                        print(f"  [{state.key}] Failed to replace SELL: {e}")
+                    order = self.client.create_limit_sell(
+                        market_id=state.market_id,
+                        outcome=outcome,
+                        price=new_price,
+                        size=info["size"],
+                        expiration=expiration,
+                        settlement_address=state.settlement_address,
+                    )
+                    pending.append((order, "to replace SELL", {
+                        "side": "SELL", "outcome": info["outcome"],
+                        "price": new_price, "size": info["size"]
+                    }))
+
+            await self._post_orders(state, pending)
 
     # ------------------------------------------------------------------
     # Market lifecycle
@@ -1062,30 +1173,31 @@ class MarketMaker:
         state.no_target = 1.0 - DEFAULT_BASE_PROBABILITY
         state.current_spread = self.base_spread
         state.yes_target_at_rebalance = DEFAULT_BASE_PROBABILITY
-        state.last_rebalance_time = 0
+        state.last_rebalance_time = float("-inf")
         state.price_tracker.reset()
         state.inventory.reset()
         state.circuit_breaker_tripped = False
         state.circuit_breaker_until = 0.0
         state.orders_pulled = False
 
-        # Fetch settlement and contract addresses
-        try:
-            markets = self.client.get_markets()
-            for market in markets:
-                if market.id == new_market_id:
-                    state.settlement_address = market.settlement_address
-                    try:
-                        stats = self.client.get_market(new_market_id)
-                        state.contract_address = stats.contract_address
-                    except Exception:
-                        pass
-                    break
-        except Exception as e:
-            print(f"[{state.key}] Warning: Could not fetch market addresses: {e}")
+        # Fetch settlement and contract addresses; the market list and the
+        # market's stats are requested together rather than back to back
+        markets, stats = await asyncio.gather(
+            asyncio.to_thread(self.client.get_markets),
+            asyncio.to_thread(self.client.get_market, new_market_id),
+            return_exceptions=True,
+        )
+        if isinstance(markets, Exception):
+            print(f"[{state.key}] Warning: Could not fetch market addresses: {markets}")
+        else:
+            market = next((m for m in markets if m.id == new_market_id), None)
+            if market is not None:
+                state.settlement_address = market.settlement_address
+                if not isinstance(stats, Exception):
+                    state.contract_address = stats.contract_address
 
         if state.settlement_address:
-            self.ensure_settlement_approved(state.settlement_address)
+            await self.ensure_settlement_approved(state.settlement_address)
 
         strike_usd = start_price / 1e6 if start_price else 0
         print(f"[{state.key}] Trading: {new_market_id[:8]}... | Strike: ${strike_usd:,.2f} | ${self.allocation_usdc:.2f} allocation")
@@ -1128,7 +1240,7 @@ class MarketMaker:
         while self.running:
             try:
                 print("[CLAIM] Scanning for claimable positions (Multicall3 discovery)...")
-                result = self.client.claim_all_winnings()
+                result = await asyncio.to_thread(self.client.claim_all_winnings)
                 tx_hash = result.get("txHash", result.get("tx_hash", "unknown"))
                 print(f"[CLAIM] 💰 Claimed winnings! TX: {tx_hash}")
 
@@ -1170,6 +1282,10 @@ class MarketMaker:
                 await asyncio.sleep(60)
             return
 
+        # Interval checks (rebalance, circuit breaker) use the event loop's
+        # monotonic clock; wall-clock time is only needed against market end times
+        clock = asyncio.get_running_loop().time
+
         while self.running:
             active_units = [(a, i) for a, i in self.trading_units if self.asset_states[f"{a}-{i}"].market_id]
             if not active_units:
@@ -1188,17 +1304,20 @@ class MarketMaker:
                     state.no_target = no
                     state.current_spread = spread
                     state.yes_target_at_rebalance = yes
-                    state.last_rebalance_time = int(time.time())
+                    state.last_rebalance_time = clock()
 
-                new_orders = await self.place_smart_quotes(state)
-                state.active_orders.update(new_orders)
+                await self.place_smart_quotes(state)
 
-            # Fast polling loop
+            # Fast polling loop, paced to a fixed cadence on the monotonic clock
+            # so the time spent quoting doesn't stretch the poll interval
+            next_tick = clock()
             while self.running:
-                await asyncio.sleep(FAST_POLL_INTERVAL)
+                next_tick = max(next_tick + FAST_POLL_INTERVAL, clock())
+                await asyncio.sleep(next_tick - clock())
 
                 prices = await self.get_current_prices()
                 now = int(time.time())
+                tick = clock()
 
                 for asset, interval in list(active_units):
                     state = self.asset_states[f"{asset}-{interval}"]
@@ -1228,7 +1347,7 @@ class MarketMaker:
 
                     # === CIRCUIT BREAKER ===
                     if state.circuit_breaker_tripped:
-                        if time.time() < state.circuit_breaker_until:
+                        if tick < state.circuit_breaker_until:
                             continue
                         state.circuit_breaker_tripped = False
                         print(f"[{state.key}] Circuit breaker RESET — resuming quoting")
@@ -1238,7 +1357,7 @@ class MarketMaker:
                         print(f"[{state.key}] ADVERSE SELECTION detected — circuit breaker for {CIRCUIT_BREAKER_COOLDOWN}s")
                         await self.cancel_asset_orders(state)
                         state.circuit_breaker_tripped = True
-                        state.circuit_breaker_until = time.time() + CIRCUIT_BREAKER_COOLDOWN
+                        state.circuit_breaker_until = tick + CIRCUIT_BREAKER_COOLDOWN
                         continue
 
                     # === COMPUTE NEW TARGETS ===
@@ -1246,7 +1365,7 @@ class MarketMaker:
 
                     # === REBALANCE DECISION ===
                     target_diff = abs(new_yes - state.yes_target_at_rebalance)
-                    time_since_rebalance = now - state.last_rebalance_time
+                    time_since_rebalance = tick - state.last_rebalance_time
 
                     should_rebalance = (
                         target_diff > REBALANCE_THRESHOLD
@@ -1271,7 +1390,7 @@ class MarketMaker:
                             f"Spread {new_spread:.1%} | Inv {state.inventory.get_net_exposure():.2f} | "
                             f"{seconds_remaining}s left"
                         )
-                        state.last_rebalance_time = now
+                        state.last_rebalance_time = tick
                         state.yes_target_at_rebalance = new_yes
                         await self.graceful_rebalance(state)
 
@@ -1314,7 +1433,6 @@ class MarketMaker:
             claim_task.cancel()
             trading_task.cancel()
             await asyncio.gather(monitor_task, claim_task, trading_task, return_exceptions=True)
-            await self.close()
 
 
 # ============================================================
@@ -1505,7 +1623,7 @@ async def main():
         print("\nShutting down...")
         bot.running = False
         await bot.cancel_all_orders()
-        await bot.close()
+        await close_shared_http_client()
         client.close()
         print("Bot stopped.")
 
@@ -39,20 +39,69 @@ Usage:
 
 import argparse
 import asyncio
-import math
+import contextlib
+import logging
+import logging.handlers
 import os
+import queue
 import re
+import signal
+import sys
 import time
+from collections import OrderedDict
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Any, Callable
+
 import httpx
+from dotenv import load_dotenv
 
-from turbine_client import TurbineClient, Outcome, Side, QuickMarket
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # orjson is optional, stdlib json works too
+
+from turbine_client import Market, Outcome, QuickMarket, Side, TurbineClient
 from turbine_client.exceptions import TurbineApiError
 
 # Load environment variables
 load_dotenv()
 
+# Bot status output. Log calls only enqueue the record; a listener thread does
+# the stdout writes, so a slow terminal or pipe never stalls the event loop.
+# PriceActionBot.run() starts the listener if nothing else has (main() starts
+# it earlier so its setup lines share the same ordered stream).
+log = logging.getLogger("turbine.price_action_bot")
+_log_queue: queue.Queue = queue.Queue()
+_log_listener: logging.handlers.QueueListener | None = None
+if not log.handlers:
+    log.addHandler(logging.handlers.QueueHandler(_log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+def start_log_listener() -> bool:
+    """Start writing queued bot status lines to stdout.
+
+    Returns:
+        True if this call started the listener, False if it was already running.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return False
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = logging.handlers.QueueListener(_log_queue, stdout_handler)
+    _log_listener.start()
+    return True
+
+
+def stop_log_listener() -> None:
+    """Write out any queued status lines and stop the listener."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 # ============================================================
 # CONFIGURATION - Adjust these parameters for your strategy
 # ============================================================
@@ -67,9 +116,16 @@ TURBINE_HOST = os.environ.get("TURBINE_HOST", "http://localhost:8080")
 DEFAULT_ORDER_SIZE_USDC = 1.0  # $1 USDC per order
 DEFAULT_MAX_POSITION_USDC = 10.0  # $10 max position per asset per market
 PRICE_POLL_SECONDS = 5  # How often to check prices
+MARKET_POLL_SECONDS = 5  # Market transition check interval while markets are far from expiry
+MIN_MARKET_POLL_SECONDS = 0.25  # Fastest transition check, used at or past expiry
+MAX_PROCESSED_TRADE_IDS = 2048  # Per-asset cap on remembered trade IDs (oldest evicted first)
+USDC_CACHE_TTL_SECONDS = 3.0  # Reuse balance/allowance reads within this window
+# Approval confirmation backoff: poll fast for typical confirmation latency, then slow down
+APPROVAL_POLL_INTERVALS = [0.5, 0.5, 0.75, 1, 1, 1.5, 2, 2, 3, 3, 5, 5, 5, 10, 10, 10]
 
 # Price Action parameters
 PRICE_THRESHOLD_BPS = 5  # 0.05% threshold before taking action
+PRICE_THRESHOLD_PCT = PRICE_THRESHOLD_BPS / 100  # Same threshold in percent
 MIN_CONFIDENCE = 0.6  # Minimum confidence to place a trade
 MAX_CONFIDENCE = 0.9  # Cap confidence at 90%
 
@@ -98,6 +154,27 @@ DEFAULT_ASSET_INTERVALS: dict[str, list[int]] = {
     "OIL": [1440],
 }
 
+# Credential lines in .env, compiled once for _save_credentials_to_env
+_RE_API_KEY_ID = re.compile(r'^TURBINE_API_KEY_ID=.*$', re.MULTILINE)
+_RE_API_PRIVATE_KEY = re.compile(r'^TURBINE_API_PRIVATE_KEY=.*$', re.MULTILINE)
+
+
+# Startup banner, rendered with a single write
+BANNER_TEMPLATE = """
+{rule}
+TURBINE PRICE ACTION BOT
+{rule}
+Wallet: {wallet}
+Chain: {chain_id}
+Assets: {assets}
+Trading units: {units}
+Order size: ${order_size:.2f} USDC
+Max position: ${max_position:.2f} USDC per asset
+USDC approval: gasless (one-time max permit per settlement)
+{balance_lines}
+{rule}
+"""
+
 
 def get_or_create_api_credentials(env_path: Path = None):
     """Get existing credentials or register new ones and save to .env."""
@@ -108,14 +185,14 @@ def get_or_create_api_credentials(env_path: Path = None):
     api_private_key = os.environ.get("TURBINE_API_PRIVATE_KEY")
 
     if api_key_id and api_private_key:
-        print("Using existing API credentials")
+        log.info("Using existing API credentials")
         return api_key_id, api_private_key
 
     private_key = os.environ.get("TURBINE_PRIVATE_KEY")
     if not private_key:
         raise ValueError("Set TURBINE_PRIVATE_KEY in your .env file")
 
-    print("Registering new API credentials...")
+    log.info("Registering new API credentials...")
     credentials = TurbineClient.request_api_credentials(
         host=TURBINE_HOST,
         private_key=private_key,
@@ -129,7 +206,7 @@ def get_or_create_api_credentials(env_path: Path = None):
     os.environ["TURBINE_API_KEY_ID"] = api_key_id
     os.environ["TURBINE_API_PRIVATE_KEY"] = api_private_key
 
-    print(f"API credentials saved to {env_path}")
+    log.info(f"API credentials saved to {env_path}")
     return api_key_id, api_private_key
 
 
@@ -138,22 +215,40 @@ def _save_credentials_to_env(env_path: Path, api_key_id: str, api_private_key: s
     env_path = Path(env_path)
 
     if env_path.exists():
-        content = env_path.read_text()
-        # Update or append each credential
-        if "TURBINE_API_KEY_ID=" in content:
-            content = re.sub(r'^TURBINE_API_KEY_ID=.*$', f'TURBINE_API_KEY_ID={api_key_id}', content, flags=re.MULTILINE)
-        else:
-            content = content.rstrip() + f"\nTURBINE_API_KEY_ID={api_key_id}"
-        if "TURBINE_API_PRIVATE_KEY=" in content:
-            content = re.sub(r'^TURBINE_API_PRIVATE_KEY=.*$', f'TURBINE_API_PRIVATE_KEY={api_private_key}', content, flags=re.MULTILINE)
-        else:
-            content = content.rstrip() + f"\nTURBINE_API_PRIVATE_KEY={api_private_key}"
-        env_path.write_text(content + "\n")
+        with open(env_path, "r+") as f:
+            content = f.read()
+            has_key_id = _RE_API_KEY_ID.search(content) is not None
+            has_private_key = _RE_API_PRIVATE_KEY.search(content) is not None
+
+            # Fast path: neither credential present, so just append the new lines
+            if not has_key_id and not has_private_key:
+                prefix = "\n" if content and not content.endswith("\n") else ""
+                f.seek(0, 2)
+                f.write(f"{prefix}TURBINE_API_KEY_ID={api_key_id}\nTURBINE_API_PRIVATE_KEY={api_private_key}\n")
+                return
+
+            # Update or append each credential
+            if has_key_id:
+                content = _RE_API_KEY_ID.sub(f'TURBINE_API_KEY_ID={api_key_id}', content)
+            else:
+                content = content.rstrip() + f"\nTURBINE_API_KEY_ID={api_key_id}"
+            if has_private_key:
+                content = _RE_API_PRIVATE_KEY.sub(f'TURBINE_API_PRIVATE_KEY={api_private_key}', content)
+            else:
+                content = content.rstrip() + f"\nTURBINE_API_PRIVATE_KEY={api_private_key}"
+            f.seek(0)
+            f.write(content.rstrip("\n") + "\n")
+            f.truncate()
     else:
         content = f"# Turbine Bot Config\nTURBINE_PRIVATE_KEY={os.environ.get('TURBINE_PRIVATE_KEY', '')}\nTURBINE_API_KEY_ID={api_key_id}\nTURBINE_API_PRIVATE_KEY={api_private_key}\n"
         env_path.write_text(content)
 
 
+def _tx_hash(result: dict) -> str:
+    """Pull the transaction hash from a relayer response (camelCase or snake_case)."""
+    return result.get("txHash") or result.get("tx_hash") or "unknown"
+
+
 class AssetState:
     """Per-asset trading state."""
 
@@ -165,12 +260,26 @@ class AssetState:
         self.settlement_address: str | None = None
         self.contract_address: str | None = None
         self.strike_price: int = 0
+        self.market_end_time: int = 0  # Unix seconds; 0 until the monitor has seen the market
         self.position_usdc: dict[str, float] = {}
         self.active_orders: dict[str, str] = {}
-        self.processed_trade_ids: set[int] = set()
+        self.processed_trade_ids: OrderedDict[int, None] = OrderedDict()
         self.pending_order_txs: set[str] = set()
         self.traded_markets: dict[str, str] = {}
 
+    @property
+    def strike_usd(self) -> float:
+        """Strike price in USD (strike_price is stored with 6 decimals)."""
+        return self.strike_price / 1e6
+
+    def mark_trade_processed(self, trade_id: int) -> None:
+        """Remember a trade ID, evicting the oldest once the cap is reached."""
+        ids = self.processed_trade_ids
+        ids[trade_id] = None
+        ids.move_to_end(trade_id)
+        if len(ids) > MAX_PROCESSED_TRADE_IDS:
+            ids.popitem(last=False)
+
 
 class PriceActionBot:
     """Price action trader for BTC, ETH, SOL, XRP, and OIL prediction markets.
@@ -190,6 +299,8 @@ class PriceActionBot:
         max_position_usdc: float = DEFAULT_MAX_POSITION_USDC,
     ):
         self.client = client
+        # Lowercased wallet address, precomputed for trade ownership filters
+        self._self_addr_lc = (client.address or "").lower()
         self.assets = assets
         self.intervals = intervals or [15, 60]
         self.asset_intervals = asset_intervals or DEFAULT_ASSET_INTERVALS
@@ -209,10 +320,39 @@ class PriceActionBot:
 
         # Track approved settlement contracts (shared across assets)
         self.approved_settlements: dict[str, int] = {}
+        self._approval_locks: dict[str, asyncio.Lock] = {}
 
         # Async HTTP client for non-blocking price fetches
         self._http_client: httpx.AsyncClient | None = None
 
+        # Markets awaiting claim across all assets: (market_id, contract_address, state).
+        # Appended on market transitions and compacted after claims, so the claim
+        # loop never has to rebuild it from every asset's traded_markets.
+        self._claim_index: list[tuple[str, str, AssetState]] = []
+
+        # Set when a market is added to traded_markets so the claim task wakes early.
+        # Created lazily so it binds to the running event loop.
+        self._new_claim_event: asyncio.Event | None = None
+        # Set by stop() to wake run() for shutdown (created lazily inside the loop)
+        self._stop_event: asyncio.Event | None = None
+
+        # Pyth price scale (10 ** expo) per feed, recomputed only if a feed's expo changes
+        self._pyth_scale: dict[str, float] = {}
+        self._pyth_expo: dict[str, int] = {}
+
+        # Short-lived cache for balance/allowance reads: key -> (fetched_at, value)
+        self._rpc_cache: dict[tuple, tuple[float, Any]] = {}
+
+    def _cached(self, key: tuple, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return a cached result for key if younger than ttl seconds, else call fn."""
+        now = time.monotonic()
+        entry = self._rpc_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = fn()
+        self._rpc_cache[key] = (now, value)
+        return value
+
     def calculate_shares_from_usdc(self, usdc_amount: float, price: int) -> int:
         """Calculate shares from USDC amount at given price.
 
@@ -226,8 +366,8 @@ class PriceActionBot:
         if price <= 0:
             return 0
         # shares = usdc / (price / 1_000_000) = usdc * 1_000_000 / price
-        # Result in 6 decimals
-        return math.ceil((usdc_amount * 1_000_000 * 1_000_000) / price)
+        # Result in 6 decimals, rounded up using integer-only ceil division
+        return -(-round(usdc_amount * 1_000_000 * 1_000_000) // price)
 
     def get_position_usdc(self, state: AssetState, market_id: str) -> float:
         """Get current position in USDC for a market."""
@@ -241,55 +381,73 @@ class PriceActionBot:
     # Half of max uint256 — threshold for "already has max approval"
     MAX_APPROVAL_THRESHOLD = (2**256 - 1) // 2
 
-    def ensure_settlement_approved(self, settlement_address: str) -> None:
+    async def ensure_settlement_approved(self, settlement_address: str) -> None:
         """Ensure USDC is approved for the settlement contract.
 
         Uses a gasless max permit via the relayer. No native gas required.
+        Confirmation is polled with backoff so the event loop is never blocked.
+        Concurrent calls for the same settlement wait on a single approval.
         """
         # Check if already approved in this session
         if settlement_address in self.approved_settlements:
             return
 
-        # Check on-chain allowance
-        current_allowance = self.client.get_usdc_allowance(spender=settlement_address)
+        # Units switching markets concurrently share one approval per settlement
+        lock = self._approval_locks.setdefault(settlement_address, asyncio.Lock())
+        async with lock:
+            # Another unit may have finished approving while we waited
+            if settlement_address in self.approved_settlements:
+                return
 
-        if current_allowance >= self.MAX_APPROVAL_THRESHOLD:
-            print(f"  Existing USDC max approval found")
-            self.approved_settlements[settlement_address] = current_allowance
-            return
+            # Check on-chain allowance
+            current_allowance = await asyncio.to_thread(
+                self._cached,
+                ("allowance", settlement_address),
+                USDC_CACHE_TTL_SECONDS,
+                lambda: self.client.get_usdc_allowance(spender=settlement_address),
+            )
 
-        # Need to approve via gasless max permit
-        print(f"\n{'='*50}")
-        print(f"GASLESS USDC APPROVAL (one-time max permit)")
-        print(f"{'='*50}")
-        print(f"Settlement: {settlement_address}")
+            if current_allowance >= self.MAX_APPROVAL_THRESHOLD:
+                log.info("  Existing USDC max approval found")
+                self.approved_settlements[settlement_address] = current_allowance
+                return
 
-        try:
-            result = self.client.approve_usdc_for_settlement(settlement_address)
-            tx_hash = result.get("tx_hash", "unknown")
-            print(f"Relayer TX: {tx_hash}")
-            print("Waiting for confirmation...")
+            # Need to approve via gasless max permit
+            log.info(f"\n{'='*50}")
+            log.info("GASLESS USDC APPROVAL (one-time max permit)")
+            log.info(f"{'='*50}")
+            log.info(f"Settlement: {settlement_address}")
 
-            # Wait for confirmation by polling allowance via API
-            for _ in range(30):
-                try:
-                    allowance = self.client.get_usdc_allowance(spender=settlement_address)
-                    if allowance >= self.MAX_APPROVAL_THRESHOLD:
-                        print(f"✓ Max USDC approval confirmed (gasless)")
-                        self.approved_settlements[settlement_address] = allowance
-                        break
-                except Exception:
-                    pass
-                time.sleep(2)
-            else:
-                print(f"⚠ Approval pending (may still confirm)")
-                self.approved_settlements[settlement_address] = 2**256 - 1
+            try:
+                result = await asyncio.to_thread(
+                    self.client.approve_usdc_for_settlement, settlement_address
+                )
+                tx_hash = result.get("tx_hash", "unknown")
+                log.info(f"Relayer TX: {tx_hash}")
+                log.info("Waiting for confirmation...")
 
-        except Exception as e:
-            print(f"✗ Gasless approval failed: {e}")
-            raise
+                # Wait for confirmation by polling allowance via API (fast first, then slower)
+                for interval in APPROVAL_POLL_INTERVALS:
+                    await asyncio.sleep(interval)
+                    try:
+                        allowance = await asyncio.to_thread(
+                            self.client.get_usdc_allowance, spender=settlement_address
+                        )
+                        if allowance >= self.MAX_APPROVAL_THRESHOLD:
+                            log.info("✓ Max USDC approval confirmed (gasless)")
+                            self.approved_settlements[settlement_address] = allowance
+                            break
+                    except Exception:
+                        pass
+                else:
+                    log.warning("⚠ Approval pending (may still confirm)")
+                    self.approved_settlements[settlement_address] = 2**256 - 1
+
+            except Exception as e:
+                log.warning(f"✗ Gasless approval failed: {e}")
+                raise
 
-        print(f"{'='*50}\n")
+            log.info(f"{'='*50}\n")
 
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
@@ -304,35 +462,39 @@ class PriceActionBot:
 
     async def cleanup_pending_orders(self, state: AssetState) -> None:
         """Check pending orders and remove any that have settled or failed."""
+        client = self.client
+        market_id = state.market_id
+        address = self._self_addr_lc
         try:
-            pending_trades = self.client.get_pending_trades()
+            pending_trades = await asyncio.to_thread(client.get_pending_trades)
             pending_txs = {t.tx_hash for t in pending_trades
-                          if t.market_id == state.market_id
-                          and t.buyer_address.lower() == self.client.address.lower()}
+                          if t.market_id == market_id
+                          and t.buyer_address.lower() == address}
 
             # Remove any TXs that are no longer pending
-            resolved_txs = state.pending_order_txs - pending_txs
+            resolved_txs = state.pending_order_txs.difference(pending_txs)
             if resolved_txs:
-                print(f"  [{state.key}] {len(resolved_txs)} order(s) settled")
-                state.pending_order_txs -= resolved_txs
+                log.info(f"  [{state.key}] {len(resolved_txs)} order(s) settled")
+                state.pending_order_txs.intersection_update(pending_txs)
 
-                # Check if they filled by looking at recent trades
-                trades = self.client.get_trades(market_id=state.market_id, limit=20)
+                # Check if they filled by looking at recent trades, fetched only
+                # now so the snapshot includes the TXs that just settled
+                trades = await asyncio.to_thread(client.get_trades, market_id=market_id, limit=20)
                 my_recent_trades = [t for t in trades
-                                   if t.buyer.lower() == self.client.address.lower()
+                                   if t.buyer.lower() == address
                                    and t.id not in state.processed_trade_ids]
 
                 for trade in my_recent_trades:
-                    state.processed_trade_ids.add(trade.id)
+                    state.mark_trade_processed(trade.id)
                     # Calculate USDC spent for this trade
                     usdc_spent = (trade.size * trade.price) / (1_000_000 * 1_000_000)
-                    state.position_usdc[state.market_id] = self.get_position_usdc(state, state.market_id) + usdc_spent
+                    state.position_usdc[market_id] = self.get_position_usdc(state, market_id) + usdc_spent
 
                     outcome_str = "YES" if trade.outcome == 0 else "NO"
-                    print(f"  [{state.key}] Filled: ${usdc_spent:.2f} USDC → {trade.size / 1_000_000:.2f} {outcome_str} shares")
+                    log.info(f"  [{state.key}] Filled: ${usdc_spent:.2f} USDC → {trade.size / 1_000_000:.2f} {outcome_str} shares")
 
         except Exception as e:
-            print(f"  [{state.key}] Warning: Could not cleanup pending orders: {e}")
+            log.warning(f"  [{state.key}] Warning: Could not cleanup pending orders: {e}")
 
     async def sync_position(self, state: AssetState) -> None:
         """Sync position by checking user positions for current market."""
@@ -340,9 +502,10 @@ class PriceActionBot:
             return
 
         try:
-            positions = self.client.get_user_positions(
+            positions = await asyncio.to_thread(
+                self.client.get_user_positions,
                 address=self.client.address,
-                chain_id=self.client.chain_id
+                chain_id=self.client.chain_id,
             )
 
             for position in positions:
@@ -352,18 +515,18 @@ class PriceActionBot:
                     estimated_usdc = (total_shares * 0.5) / 1_000_000
 
                     if total_shares > 0:
-                        print(f"[{state.key}] Position synced: ~${estimated_usdc:.2f} USDC in shares")
+                        log.info(f"[{state.key}] Position synced: ~${estimated_usdc:.2f} USDC in shares")
                         state.position_usdc[state.market_id] = estimated_usdc
                     else:
-                        print(f"[{state.key}] Position synced: No existing positions")
+                        log.info(f"[{state.key}] Position synced: No existing positions")
                         state.position_usdc[state.market_id] = 0.0
                     return
 
             state.position_usdc[state.market_id] = 0.0
-            print(f"[{state.key}] Position synced: No existing positions")
+            log.info(f"[{state.key}] Position synced: No existing positions")
 
         except Exception as e:
-            print(f"[{state.key}] Failed to sync position: {e}")
+            log.warning(f"[{state.key}] Failed to sync position: {e}")
             state.position_usdc[state.market_id] = 0.0
 
     async def get_current_prices(self) -> dict[str, float]:
@@ -376,7 +539,7 @@ class PriceActionBot:
                 params=[("ids[]", fid) for fid in feed_ids],
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             prices: dict[str, float] = {}
             if not data.get("parsed"):
@@ -392,12 +555,17 @@ class PriceActionBot:
                     price_data = parsed["price"]
                     price_int = int(price_data["price"])
                     expo = price_data["expo"]
-                    prices[asset] = price_int * (10 ** expo)
+                    scale = self._pyth_scale.get(feed_id)
+                    if scale is None or expo != self._pyth_expo.get(feed_id):
+                        scale = 10.0 ** expo
+                        self._pyth_scale[feed_id] = scale
+                        self._pyth_expo[feed_id] = expo
+                    prices[asset] = price_int * scale
 
             return prices
 
         except Exception as e:
-            print(f"Failed to fetch prices from Pyth: {e}")
+            log.warning(f"Failed to fetch prices from Pyth: {e}")
             return {}
 
     async def calculate_signal(self, state: AssetState, current_price: float) -> tuple[str, float]:
@@ -405,24 +573,23 @@ class PriceActionBot:
         if current_price <= 0:
             return "HOLD", 0.0
 
-        strike_usd = state.strike_price / 1e6
+        strike_usd = state.strike_usd
         if strike_usd <= 0:
             return "HOLD", 0.0
 
         price_diff_pct = ((current_price - strike_usd) / strike_usd) * 100
-        threshold_pct = PRICE_THRESHOLD_BPS / 100
+        abs_diff_pct = abs(price_diff_pct)
 
-        if abs(price_diff_pct) < threshold_pct:
+        if abs_diff_pct < PRICE_THRESHOLD_PCT:
             return "HOLD", 0.0
 
-        raw_confidence = min(abs(price_diff_pct) / 2, MAX_CONFIDENCE)
-        confidence = max(raw_confidence, MIN_CONFIDENCE) if abs(price_diff_pct) >= threshold_pct else 0.0
+        confidence = max(min(abs_diff_pct * 0.5, MAX_CONFIDENCE), MIN_CONFIDENCE)
 
         if price_diff_pct > 0:
-            print(f"[{state.key}] ${current_price:,.2f} is {price_diff_pct:+.2f}% above strike ${strike_usd:,.2f}")
+            log.info(f"[{state.key}] ${current_price:,.2f} is {price_diff_pct:+.2f}% above strike ${strike_usd:,.2f}")
             return "BUY_YES", confidence
         else:
-            print(f"[{state.key}] ${current_price:,.2f} is {price_diff_pct:+.2f}% below strike ${strike_usd:,.2f}")
+            log.info(f"[{state.key}] ${current_price:,.2f} is {price_diff_pct:+.2f}% below strike ${strike_usd:,.2f}")
             return "BUY_NO", confidence
 
     def confidence_to_price(self, action: str, confidence: float) -> int:
@@ -454,39 +621,46 @@ class PriceActionBot:
         if action == "HOLD" or confidence < MIN_CONFIDENCE:
             return
 
+        client = self.client
+        market_id = state.market_id
+        order_size = self.order_size_usdc
+
         # Check position limits (in USDC)
-        if not self.can_trade(state, self.order_size_usdc):
-            current = self.get_position_usdc(state, state.market_id)
-            print(f"[{state.key}] Position limit reached: ${current:.2f} / ${self.max_position_usdc:.2f}")
+        if not self.can_trade(state, order_size):
+            current = self.get_position_usdc(state, market_id)
+            log.info(f"[{state.key}] Position limit reached: ${current:.2f} / ${self.max_position_usdc:.2f}")
             return
 
         outcome = Outcome.YES if action == "BUY_YES" else Outcome.NO
 
         # Calculate our limit price from the signal confidence
         price = self.confidence_to_price(action, confidence)
-        print(f"[{state.key}] Posting resting bid at {price / 10000:.1f}% (conf: {confidence:.0%})")
+        log.info(f"[{state.key}] Posting resting bid at {price / 10000:.1f}% (conf: {confidence:.0%})")
 
         # Calculate shares from USDC amount
-        shares = self.calculate_shares_from_usdc(self.order_size_usdc, price)
+        shares = self.calculate_shares_from_usdc(order_size, price)
         if shares <= 0:
-            print(f"[{state.key}] Order too small: ${self.order_size_usdc:.2f} at {price/10000:.1f}%")
+            log.info(f"[{state.key}] Order too small: ${order_size:.2f} at {price/10000:.1f}%")
             return
 
         # Check USDC balance before trading
         try:
-            usdc_balance = self.client.get_usdc_balance()
+            usdc_balance = await asyncio.to_thread(
+                self._cached, ("balance",), USDC_CACHE_TTL_SECONDS, client.get_usdc_balance
+            )
             balance_usdc = usdc_balance / 1_000_000
-            if balance_usdc < self.order_size_usdc:
-                print(f"[{state.key}] Insufficient USDC balance: ${balance_usdc:.2f} < ${self.order_size_usdc:.2f} order size")
-                print(f"   Fund wallet: {self.client.address}")
+            if balance_usdc < order_size:
+                log.warning(f"[{state.key}] Insufficient USDC balance: ${balance_usdc:.2f} < ${order_size:.2f} order size")
+                log.info(f"   Fund wallet: {client.address}")
                 return
         except Exception:
             pass  # Don't block trading if balance check fails
 
         try:
             # Create order without per-trade permit (using max permit allowance)
-            order = self.client.create_limit_buy(
-                market_id=state.market_id,
+            order = await asyncio.to_thread(
+                client.create_limit_buy,
+                market_id=market_id,
                 outcome=outcome,
                 price=price,
                 size=shares,
@@ -494,37 +668,49 @@ class PriceActionBot:
                 settlement_address=state.settlement_address,
             )
 
-            result = self.client.post_order(order)
+            result = await asyncio.to_thread(client.post_order, order)
             outcome_str = "YES" if outcome == Outcome.YES else "NO"
 
             if result and isinstance(result, dict):
                 status = result.get("status", "unknown")
                 order_hash = result.get("orderHash", order.order_hash)
 
-                print(f"[{state.key}] -> Order submitted: {outcome_str} @ {price / 10000:.1f}% | ${self.order_size_usdc:.2f} = {shares/1_000_000:.4f} shares (status: {status})")
+                log.info(f"[{state.key}] -> Order submitted: {outcome_str} @ {price / 10000:.1f}% | ${order_size:.2f} = {shares/1_000_000:.4f} shares (status: {status})")
 
                 # Verify order status in background (don't block next order)
                 asyncio.create_task(self._verify_order(state, order_hash, action, shares))
 
             else:
-                print(f"[{state.key}] Unexpected order response: {result}")
+                log.warning(f"[{state.key}] Unexpected order response: {result}")
 
         except TurbineApiError as e:
-            print(f"[{state.key}] Order failed: {e}")
+            log.warning(f"[{state.key}] Order failed: {e}")
         except Exception as e:
-            print(f"[{state.key}] Unexpected error: {e}")
+            log.warning(f"[{state.key}] Unexpected error: {e}")
 
     async def _verify_order(self, state: AssetState, order_hash: str, action: str, shares: int) -> None:
         """Background task to check order status after submission."""
+        client = self.client
+        market_id = state.market_id
+        address = self._self_addr_lc
         try:
             await asyncio.sleep(2)
 
+            # Classify in priority order: failed > pending > filled > open. Failed and
+            # pending are fetched together; later checks only run if nothing matched.
+            failed_trades, pending_trades = await asyncio.gather(
+                asyncio.to_thread(client.get_failed_trades),
+                asyncio.to_thread(client.get_pending_trades),
+                return_exceptions=True,
+            )
+
             # Check for failed trades
-            try:
-                failed_trades = self.client.get_failed_trades()
+            if isinstance(failed_trades, Exception):
+                log.warning(f"  [{state.key}] Warning: Could not check failed trades: {failed_trades}")
+            else:
                 my_failed = [t for t in failed_trades
-                             if t.market_id == state.market_id
-                             and t.buyer_address.lower() == self.client.address.lower()
+                             if t.market_id == market_id
+                             and t.buyer_address.lower() == address
                              and t.fill_size == shares]
 
                 if my_failed:
@@ -532,88 +718,92 @@ class PriceActionBot:
                     reason = failed.reason
                     if "simulation" in reason.lower():
                         try:
-                            usdc_balance = self.client.get_usdc_balance()
+                            usdc_balance = await asyncio.to_thread(
+                                self._cached, ("balance",), USDC_CACHE_TTL_SECONDS, client.get_usdc_balance
+                            )
                             balance_usdc = usdc_balance / 1_000_000
                             reason += f" (USDC balance: ${balance_usdc:.2f})"
                         except Exception:
                             pass
-                    print(f"[{state.key}] Order FAILED: {reason}")
+                    log.warning(f"[{state.key}] Order FAILED: {reason}")
                     return
-            except Exception as e:
-                print(f"  [{state.key}] Warning: Could not check failed trades: {e}")
 
             # Check for pending trades
-            try:
-                pending_trades = self.client.get_pending_trades()
+            if isinstance(pending_trades, Exception):
+                log.warning(f"  [{state.key}] Warning: Could not check pending trades: {pending_trades}")
+            else:
                 my_pending = [t for t in pending_trades
-                              if t.market_id == state.market_id
-                              and t.buyer_address.lower() == self.client.address.lower()
+                              if t.market_id == market_id
+                              and t.buyer_address.lower() == address
                               and t.fill_size == shares]
 
                 if my_pending:
                     pending = my_pending[0]
-                    print(f"[{state.key}] Order PENDING on-chain (TX: {pending.tx_hash[:16]}...)")
+                    log.info(f"[{state.key}] Order PENDING on-chain (TX: {pending.tx_hash[:16]}...)")
                     state.pending_order_txs.add(pending.tx_hash)
                     return
-            except Exception as e:
-                print(f"  [{state.key}] Warning: Could not check pending trades: {e}")
 
             # Check if immediately filled
             try:
-                trades = self.client.get_trades(market_id=state.market_id, limit=20)
+                trades = await asyncio.to_thread(client.get_trades, market_id=market_id, limit=20)
+            except Exception as e:
+                log.warning(f"  [{state.key}] Warning: Could not check trades: {e}")
+            else:
                 recent_threshold = time.time() - 10
                 my_trades = [t for t in trades
-                             if t.buyer.lower() == self.client.address.lower()
+                             if t.buyer.lower() == address
                              and t.timestamp > recent_threshold
                              and t.id not in state.processed_trade_ids]
 
                 if my_trades:
                     trade = my_trades[0]
-                    state.processed_trade_ids.add(trade.id)
+                    state.mark_trade_processed(trade.id)
 
                     # Track position in USDC
                     usdc_spent = (trade.size * trade.price) / (1_000_000 * 1_000_000)
-                    state.position_usdc[state.market_id] = self.get_position_usdc(state, state.market_id) + usdc_spent
+                    state.position_usdc[market_id] = self.get_position_usdc(state, market_id) + usdc_spent
 
-                    print(f"[{state.key}] FILLED: ${usdc_spent:.2f} USDC -> {trade.size / 1_000_000:.4f} shares")
+                    log.info(f"[{state.key}] FILLED: ${usdc_spent:.2f} USDC -> {trade.size / 1_000_000:.4f} shares")
                     return
-            except Exception as e:
-                print(f"  [{state.key}] Warning: Could not check trades: {e}")
 
             # Check if still open on orderbook
             try:
-                my_orders = self.client.get_orders(
-                    trader=self.client.address,
-                    market_id=state.market_id,
+                my_orders = await asyncio.to_thread(
+                    client.get_orders,
+                    trader=client.address,
+                    market_id=market_id,
                 )
                 matching = [o for o in my_orders if o.order_hash == order_hash]
 
                 if matching:
-                    print(f"[{state.key}] Order OPEN on orderbook")
+                    log.info(f"[{state.key}] Order OPEN on orderbook")
                     state.active_orders[order_hash] = action
                 else:
-                    print(f"[{state.key}] Order not found - may have been rejected")
+                    log.info(f"[{state.key}] Order not found - may have been rejected")
             except Exception as e:
-                print(f"  [{state.key}] Warning: Could not check open orders: {e}")
+                log.warning(f"  [{state.key}] Warning: Could not check open orders: {e}")
 
         except Exception as e:
-            print(f"  [{state.key}] Verification error: {e}")
+            log.warning(f"  [{state.key}] Verification error: {e}")
 
     async def price_action_loop(self) -> None:
         """Main loop that monitors prices and executes trades for all assets."""
         if CLAIM_ONLY_MODE:
-            print("CLAIM ONLY MODE - Trading disabled")
-            while self.running:
-                await asyncio.sleep(60)
+            log.info("CLAIM ONLY MODE - Trading disabled")
+            await self._get_stop_event().wait()
             return
 
+        asset_states = self.asset_states
+        max_position = self.max_position_usdc
         while self.running:
             try:
                 # Fetch all prices in one request
                 prices = await self.get_current_prices()
 
+                # Pass 1: housekeeping and signals (cheap); collect actionable signals
+                to_execute: list[tuple[AssetState, str, float]] = []
                 for asset, interval in self.trading_units:
-                    state = self.asset_states[f"{asset}-{interval}"]
+                    state = asset_states[f"{asset}-{interval}"]
                     if not state.market_id:
                         continue
 
@@ -627,22 +817,30 @@ class PriceActionBot:
                     action, confidence = await self.calculate_signal(state, current_price)
 
                     if action != "HOLD":
-                        await self.execute_signal(state, action, confidence)
+                        to_execute.append((state, action, confidence))
                     else:
-                        strike_usd = state.strike_price / 1e6
+                        strike_usd = state.strike_usd
                         if strike_usd > 0:
                             diff_pct = ((current_price - strike_usd) / strike_usd) * 100
                             pos = self.get_position_usdc(state, state.market_id)
-                            print(f"[{state.key}] ${current_price:,.2f} ({diff_pct:+.2f}% from ${strike_usd:,.2f}) | Pos: ${pos:.2f}/${self.max_position_usdc:.2f} - HOLD")
+                            log.info(f"[{state.key}] ${current_price:,.2f} ({diff_pct:+.2f}% from ${strike_usd:,.2f}) | Pos: ${pos:.2f}/${max_position:.2f} - HOLD")
+
+                # Pass 2: place orders for all trading units concurrently
+                if to_execute:
+                    await asyncio.gather(
+                        *(self.execute_signal(s, a, c) for s, a, c in to_execute),
+                        return_exceptions=True,
+                    )
 
                 await asyncio.sleep(PRICE_POLL_SECONDS)
             except Exception as e:
-                print(f"Price action error: {e}")
+                log.warning(f"Price action error: {e}")
                 await asyncio.sleep(PRICE_POLL_SECONDS)
 
     async def get_active_market(self, asset: str, interval: int = 15) -> tuple[str, int, int] | None:
         """Get the currently active quick market for an asset."""
-        response = self.client._http.get(
+        response = await asyncio.to_thread(
+            self.client._http.get,
             f"/api/v1/quick-markets/{asset}",
             params={"interval": interval},
         )
@@ -655,27 +853,19 @@ class PriceActionBot:
     async def cancel_all_orders(self) -> None:
         """Cancel all open orders by querying the API."""
         try:
-            open_orders = self.client.get_orders(
-                trader=self.client.address, status="open"
+            open_orders = await asyncio.to_thread(
+                self.client.get_orders, trader=self.client.address, status="open"
             )
         except Exception as e:
-            print(f"Failed to fetch open orders: {e}")
+            log.warning(f"Failed to fetch open orders: {e}")
             return
 
         if not open_orders:
             return
 
-        print(f"Cancelling {len(open_orders)} orders...")
-        for order in open_orders:
-            try:
-                self.client.cancel_order(
-                    order.order_hash,
-                    market_id=order.market_id,
-                    side=Side(order.side),
-                )
-            except TurbineApiError as e:
-                if "404" not in str(e):
-                    print(f"Failed to cancel order: {e}")
+        log.info(f"Cancelling {len(open_orders)} orders...")
+        for e in await self._cancel_orders(open_orders):
+            log.warning(f"Failed to cancel order: {e}")
 
         for state in self.asset_states.values():
             state.active_orders.clear()
@@ -685,44 +875,90 @@ class PriceActionBot:
         if not state.market_id:
             return
         try:
-            open_orders = self.client.get_orders(
+            open_orders = await asyncio.to_thread(
+                self.client.get_orders,
                 trader=self.client.address,
                 market_id=state.market_id,
                 status="open",
             )
         except Exception as e:
-            print(f"[{state.key}] Failed to fetch open orders: {e}")
+            log.warning(f"[{state.key}] Failed to fetch open orders: {e}")
             return
 
         if not open_orders:
             return
 
-        print(f"[{state.key}] Cancelling {len(open_orders)} orders...")
-        for order in open_orders:
-            try:
-                self.client.cancel_order(
+        log.info(f"[{state.key}] Cancelling {len(open_orders)} orders...")
+        for e in await self._cancel_orders(open_orders):
+            log.warning(f"[{state.key}] Failed to cancel order: {e}")
+        state.active_orders.clear()
+
+    async def _cancel_orders(self, orders: list) -> list[Exception]:
+        """Cancel orders concurrently and return the errors worth reporting.
+
+        404s are ignored since the order is already gone (filled or cancelled).
+        """
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.client.cancel_order,
                     order.order_hash,
                     market_id=order.market_id,
                     side=Side(order.side),
                 )
-            except TurbineApiError as e:
-                if "404" not in str(e):
-                    print(f"[{state.key}] Failed to cancel order: {e}")
-        state.active_orders.clear()
+                for order in orders
+            ),
+            return_exceptions=True,
+        )
+        return [
+            r for r in results
+            if isinstance(r, Exception)
+            and not (isinstance(r, TurbineApiError) and "404" in str(r))
+        ]
+
+    async def _get_markets_by_id(self) -> dict[str, Market]:
+        """Fetch all markets once and index them by market ID."""
+        markets = await asyncio.to_thread(self.client.get_markets)
+        return {market.id: market for market in markets}
+
+    async def _try_get_markets_by_id(self) -> dict[str, Market] | None:
+        """Fetch the market index to share across switches, or None if it fails.
+
+        On None, each switch_to_new_market call fetches the list itself and
+        warns if it still cannot get the new market's addresses.
+        """
+        try:
+            return await self._get_markets_by_id()
+        except Exception as e:
+            log.warning(f"Warning: Could not fetch markets: {e}")
+            return None
 
-    async def switch_to_new_market(self, state: AssetState, new_market_id: str, start_price: int = 0) -> None:
-        """Switch an asset to a new market and ensure gasless USDC approval."""
+    async def switch_to_new_market(
+        self,
+        state: AssetState,
+        new_market_id: str,
+        start_price: int = 0,
+        markets_by_id: dict[str, Market] | None = None,
+    ) -> None:
+        """Switch an asset to a new market and ensure gasless USDC approval.
+
+        Pass markets_by_id when switching several assets at once so the market
+        list is fetched a single time and shared.
+        """
         old_market_id = state.market_id
 
         # Track old market for claiming winnings
         if old_market_id and state.contract_address:
+            if old_market_id not in state.traded_markets:
+                self._claim_index.append((old_market_id, state.contract_address, state))
             state.traded_markets[old_market_id] = state.contract_address
+            self._get_claim_event().set()
 
         if old_market_id:
-            print(f"\n{'='*50}")
-            print(f"[{state.key}] MARKET TRANSITION")
-            print(f"Old: {old_market_id[:8]}... | New: {new_market_id[:8]}...")
-            print(f"{'='*50}\n")
+            log.info(f"\n{'='*50}")
+            log.info(f"[{state.key}] MARKET TRANSITION")
+            log.info(f"Old: {old_market_id[:8]}... | New: {new_market_id[:8]}...")
+            log.info(f"{'='*50}\n")
             await self.cancel_asset_orders(state)
 
         # Update market state
@@ -734,55 +970,105 @@ class PriceActionBot:
 
         # Fetch settlement and contract addresses
         try:
-            markets = self.client.get_markets()
-            for market in markets:
-                if market.id == new_market_id:
-                    state.settlement_address = market.settlement_address
-                    try:
-                        stats = self.client.get_market(new_market_id)
-                        state.contract_address = stats.contract_address
-                    except Exception:
-                        pass
-                    break
+            if markets_by_id is None:
+                markets_by_id = await self._get_markets_by_id()
+            market = markets_by_id.get(new_market_id)
+            if market is not None:
+                state.settlement_address = market.settlement_address
+                try:
+                    stats = await asyncio.to_thread(self.client.get_market, new_market_id)
+                    state.contract_address = stats.contract_address
+                except Exception:
+                    pass
         except Exception as e:
-            print(f"[{state.key}] Warning: Could not fetch market addresses: {e}")
+            log.warning(f"[{state.key}] Warning: Could not fetch market addresses: {e}")
 
         # Ensure gasless USDC approval for this settlement contract
         if state.settlement_address:
-            self.ensure_settlement_approved(state.settlement_address)
+            await self.ensure_settlement_approved(state.settlement_address)
 
         strike_usd = start_price / 1e6 if start_price else 0
-        print(f"[{state.key}] Trading market: {new_market_id[:8]}... | Strike: ${strike_usd:,.2f}")
+        log.info(f"[{state.key}] Trading market: {new_market_id[:8]}... | Strike: ${strike_usd:,.2f}")
 
         await self.sync_position(state)
 
+    def _market_poll_interval(self) -> float:
+        """Scale the transition poll interval with the nearest market expiry.
+
+        Polls slowly while every market has time left and tightens to
+        MIN_MARKET_POLL_SECONDS as the soonest one approaches expiry. Markets
+        that have already ended are ignored, so a unit with no next market
+        listed falls back to MARKET_POLL_SECONDS.
+        """
+        now = time.time()
+        end_times = [s.market_end_time for s in self.asset_states.values() if s.market_end_time > now]
+        if not end_times:
+            return MARKET_POLL_SECONDS
+        time_to_expiry = min(end_times) - now
+        return max(MIN_MARKET_POLL_SECONDS, min(MARKET_POLL_SECONDS, time_to_expiry / 10))
+
     async def monitor_market_transitions(self) -> None:
         """Background task that polls for new markets across all assets."""
-        POLL_INTERVAL = 5
-
         while self.running:
             try:
-                for asset, interval in self.trading_units:
-                    state = self.asset_states[f"{asset}-{interval}"]
+                # Poll every trading unit concurrently so one slow lookup doesn't delay the rest
+                results = await asyncio.gather(*(
+                    self._poll_market(self.asset_states[f"{asset}-{interval}"])
+                    for asset, interval in self.trading_units
+                ))
+                transitions = [r for r in results if r is not None]
+
+                if transitions:
+                    # Fetch the market list once for every unit that is switching
+                    markets_by_id = await self._try_get_markets_by_id()
+                    await asyncio.gather(*(
+                        self.switch_to_new_market(state, new_market_id, start_price, markets_by_id)
+                        for state, new_market_id, start_price in transitions
+                    ))
+            except Exception as e:
+                log.warning(f"Market monitor error: {e}")
 
-                    try:
-                        market_info = await self.get_active_market(asset, interval)
-                    except Exception as e:
-                        print(f"[{state.key}] Market monitor error: {e}")
-                        continue
+            await asyncio.sleep(self._market_poll_interval())
 
-                    if not market_info:
-                        continue
+    async def _poll_market(self, state: AssetState) -> tuple[AssetState, str, int] | None:
+        """Check one trading unit for a new market.
 
-                    new_market_id, end_time, start_price = market_info
+        Returns (state, new_market_id, start_price) if the unit should switch, else None.
+        """
+        try:
+            market_info = await self.get_active_market(state.asset, state.interval)
+        except Exception as e:
+            log.warning(f"[{state.key}] Market monitor error: {e}")
+            return None
 
-                    if new_market_id != state.market_id:
-                        await self.switch_to_new_market(state, new_market_id, start_price)
+        if not market_info:
+            # No market listed (e.g. outside trading hours); forget the old expiry
+            state.market_end_time = 0
+            return None
 
-            except Exception as e:
-                print(f"Market monitor error: {e}")
+        new_market_id, end_time, start_price = market_info
+        state.market_end_time = end_time
+
+        if new_market_id != state.market_id:
+            return state, new_market_id, start_price
+        return None
+
+    def _get_stop_event(self) -> asyncio.Event:
+        """Get or create the event that signals shutdown."""
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+        return self._stop_event
 
-            await asyncio.sleep(POLL_INTERVAL)
+    def stop(self) -> None:
+        """Ask a running bot to shut down; run() then cancels its orders and returns."""
+        self.running = False
+        self._get_stop_event().set()
+
+    def _get_claim_event(self) -> asyncio.Event:
+        """Get or create the event that signals new markets to claim."""
+        if self._new_claim_event is None:
+            self._new_claim_event = asyncio.Event()
+        return self._new_claim_event
 
     async def claim_resolved_markets(self) -> None:
         """Background task to claim winnings from resolved markets across all assets."""
@@ -790,25 +1076,27 @@ class PriceActionBot:
 
         while self.running:
             try:
-                # Collect all traded markets across all assets
-                all_traded: list[tuple[str, str, AssetState]] = []
-                for state in self.asset_states.values():
-                    for market_id, contract_address in list(state.traded_markets.items()):
-                        all_traded.append((market_id, contract_address, state))
+                # All traded markets across all assets awaiting claim
+                all_traded = self._claim_index
 
                 if not all_traded:
-                    await asyncio.sleep(retry_delay)
+                    # Nothing to claim yet: sleep until a market is traded (or the retry delay)
+                    claim_event = self._get_claim_event()
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(claim_event.wait(), timeout=retry_delay)
+                    claim_event.clear()
                     continue
 
-                # Collect all resolved markets first
-                resolved: list[tuple[str, str, AssetState]] = []
-                for market_id, contract_address, state in all_traded:
-                    try:
-                        resolution = self.client.get_resolution(market_id)
-                        if resolution and resolution.resolved:
-                            resolved.append((market_id, contract_address, state))
-                    except Exception:
-                        continue
+                # Check resolution of every traded market concurrently (one round trip)
+                resolutions = await asyncio.gather(
+                    *(asyncio.to_thread(self.client.get_resolution, market_id)
+                      for market_id, _, _ in all_traded),
+                    return_exceptions=True,
+                )
+                resolved: list[tuple[str, str, AssetState]] = [
+                    traded for traded, resolution in zip(all_traded, resolutions)
+                    if not isinstance(resolution, Exception) and resolution and resolution.resolved
+                ]
 
                 if not resolved:
                     await asyncio.sleep(retry_delay)
@@ -816,56 +1104,80 @@ class PriceActionBot:
 
                 # Batch claim in one transaction
                 market_addresses = [addr for _, addr, _ in resolved]
+                claimed = False
                 try:
-                    result = self.client.batch_claim_winnings(market_addresses)
-                    tx_hash = result.get("txHash", result.get("tx_hash", "unknown"))
-                    print(f"💰 Batch claimed {len(resolved)} markets TX: {tx_hash}")
-                    for market_id, _, state in resolved:
-                        del state.traded_markets[market_id]
+                    result = await asyncio.to_thread(self.client.batch_claim_winnings, market_addresses)
+                    tx_hash = _tx_hash(result)
+                    log.info(f"💰 Batch claimed {len(resolved)} markets TX: {tx_hash}")
+                    claimed = True
                 except ValueError as e:
                     if "no winning tokens" in str(e).lower():
-                        for market_id, _, state in resolved:
-                            del state.traded_markets[market_id]
+                        claimed = True
                 except Exception as e:
-                    print(f"Batch claim error: {e}")
+                    log.warning(f"Batch claim error: {e}")
+
+                if claimed:
+                    # Drop claimed markets in one pass after the sweep
+                    done = {market_id for market_id, _, _ in resolved}
+                    for market_id, _, state in resolved:
+                        state.traded_markets.pop(market_id, None)
+                    self._claim_index = [t for t in self._claim_index if t[0] not in done]
 
             except Exception as e:
-                print(f"Claim monitor error: {e}")
+                log.warning(f"Claim monitor error: {e}")
 
             await asyncio.sleep(retry_delay)
 
+    async def _init_unit(
+        self, asset: str, interval: int, markets_by_id: dict[str, Market] | None
+    ) -> None:
+        """Fetch and switch to the current market for one trading unit at startup."""
+        try:
+            market_info = await self.get_active_market(asset, interval)
+            if market_info:
+                market_id, end_time, start_price = market_info
+                state = self.asset_states[f"{asset}-{interval}"]
+                state.market_end_time = end_time
+                await self.switch_to_new_market(state, market_id, start_price, markets_by_id)
+            else:
+                log.info(f"[{asset}-{interval}] Waiting for market...")
+        except Exception as e:
+            log.warning(f"[{asset}-{interval}] Failed to get initial market: {e}")
+
     async def run(self) -> None:
         """Main trading loop."""
+        owns_log_listener = start_log_listener()
         monitor_task = asyncio.create_task(self.monitor_market_transitions())
         claim_task = asyncio.create_task(self.claim_resolved_markets())
         price_task = asyncio.create_task(self.price_action_loop())
+        stop_task = asyncio.create_task(self._get_stop_event().wait())
 
         try:
-            # Initialize all asset markets
-            for asset, interval in self.trading_units:
-                try:
-                    market_info = await self.get_active_market(asset, interval)
-                    if market_info:
-                        market_id, _, start_price = market_info
-                        await self.switch_to_new_market(self.asset_states[f"{asset}-{interval}"], market_id, start_price)
-                    else:
-                        print(f"[{asset}-{interval}] Waiting for market...")
-                except Exception as e:
-                    print(f"[{asset}-{interval}] Failed to get initial market: {e}")
-
-            while self.running:
-                await asyncio.sleep(1)
+            # Initialize all asset markets concurrently over one shared market list
+            markets_by_id = await self._try_get_markets_by_id()
+            await asyncio.gather(*(
+                self._init_unit(asset, interval, markets_by_id)
+                for asset, interval in self.trading_units
+            ))
+
+            # Sleep until stop() is called or a background task exits
+            await asyncio.wait(
+                {monitor_task, claim_task, price_task, stop_task},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
 
         except (KeyboardInterrupt, asyncio.CancelledError):
             pass
         finally:
             self.running = False
-            monitor_task.cancel()
-            claim_task.cancel()
-            price_task.cancel()
-            await asyncio.gather(monitor_task, claim_task, price_task, return_exceptions=True)
+            tasks = (monitor_task, claim_task, price_task, stop_task)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             await self.cancel_all_orders()
             await self.close()
+            if owns_log_listener:
+                stop_log_listener()
 
 
 async def main():
@@ -945,68 +1257,83 @@ async def main():
         print("Error: Set TURBINE_PRIVATE_KEY in your .env file")
         return
 
-    api_key_id, api_private_key = get_or_create_api_credentials()
+    # Setup lines, the banner and bot status all go through the same ordered log stream
+    start_log_listener()
+    try:
+        api_key_id, api_private_key = get_or_create_api_credentials()
+
+        client = TurbineClient(
+            host=TURBINE_HOST,
+            chain_id=CHAIN_ID,
+            private_key=private_key,
+            api_key_id=api_key_id,
+            api_private_key=api_private_key,
+        )
 
-    client = TurbineClient(
-        host=TURBINE_HOST,
-        chain_id=CHAIN_ID,
-        private_key=private_key,
-        api_key_id=api_key_id,
-        api_private_key=api_private_key,
-    )
+        # Build trading units for display
+        trading_units = []
+        for asset in assets:
+            for interval in asset_intervals.get(asset, intervals):
+                trading_units.append((asset, interval))
 
-    # Build trading units for display
-    trading_units = []
-    for asset in assets:
-        for interval in asset_intervals.get(asset, intervals):
-            trading_units.append((asset, interval))
+        # Format per-asset intervals for banner
+        asset_interval_strs = []
+        for asset in assets:
+            ai = asset_intervals.get(asset, intervals)
+            asset_interval_strs.append(f"{asset} ({', '.join(str(i) + 'm' for i in ai)})")
 
-    # Format per-asset intervals for banner
-    asset_interval_strs = []
-    for asset in assets:
-        ai = asset_intervals.get(asset, intervals)
-        asset_interval_strs.append(f"{asset} ({', '.join(str(i) + 'm' for i in ai)})")
-
-    print(f"\n{'='*60}")
-    print(f"TURBINE PRICE ACTION BOT")
-    print(f"{'='*60}")
-    print(f"Wallet: {client.address}")
-    print(f"Chain: {CHAIN_ID}")
-    print(f"Assets: {', '.join(asset_interval_strs)}")
-    print(f"Trading units: {len(trading_units)}")
-    print(f"Order size: ${args.order_size:.2f} USDC")
-    print(f"Max position: ${args.max_position:.2f} USDC per asset")
-    print(f"USDC approval: gasless (one-time max permit per settlement)")
-    try:
-        usdc_balance = client.get_usdc_balance()
-        balance_display = usdc_balance / 1_000_000
-        print(f"USDC balance: ${balance_display:.2f}")
-        min_needed = args.order_size * len(trading_units)
-        if balance_display < min_needed:
-            print(f"⚠️  Warning: Balance (${balance_display:.2f}) may be low for {len(trading_units)} trading units")
-            print(f"   Fund your wallet: {client.address}")
-    except Exception as e:
-        print(f"USDC balance: unknown ({e})")
-    print(f"{'='*60}\n")
-
-    bot = PriceActionBot(
-        client,
-        assets=assets,
-        intervals=intervals,
-        asset_intervals=asset_intervals,
-        order_size_usdc=args.order_size,
-        max_position_usdc=args.max_position,
-    )
+        try:
+            usdc_balance = client.get_usdc_balance()
+            balance_display = usdc_balance / 1_000_000
+            balance_lines = f"USDC balance: ${balance_display:.2f}"
+            min_needed = args.order_size * len(trading_units)
+            if balance_display < min_needed:
+                balance_lines += (
+                    f"\n⚠️  Warning: Balance (${balance_display:.2f}) may be low for {len(trading_units)} trading units"
+                    f"\n   Fund your wallet: {client.address}"
+                )
+        except Exception as e:
+            balance_lines = f"USDC balance: unknown ({e})"
+
+        rule = "=" * 60
+        log.info(BANNER_TEMPLATE.format(
+            rule=rule,
+            wallet=client.address,
+            chain_id=CHAIN_ID,
+            assets=", ".join(asset_interval_strs),
+            units=len(trading_units),
+            order_size=args.order_size,
+            max_position=args.max_position,
+            balance_lines=balance_lines,
+        ))
+
+        bot = PriceActionBot(
+            client,
+            assets=assets,
+            intervals=intervals,
+            asset_intervals=asset_intervals,
+            order_size_usdc=args.order_size,
+            max_position_usdc=args.max_position,
+        )
 
-    try:
-        await bot.run()
-    except KeyboardInterrupt:
-        pass
+        def request_stop() -> None:
+            log.info("\nShutting down...")
+            bot.stop()
+
+        # Ctrl+C / SIGTERM stop the running bot, which cancels its open orders on the way out
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError):  # no signal handlers on Windows
+                loop.add_signal_handler(sig, request_stop)
+
+        try:
+            await bot.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            client.close()
     finally:
-        print("\nShutting down...")
-        bot.running = False
-        await bot.cancel_all_orders()
-        client.close()
+        stop_log_listener()  # writes out any queued status lines
         print("Bot stopped.")
 
 
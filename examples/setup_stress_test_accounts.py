@@ -18,10 +18,14 @@ Output:
 
 import argparse
 import os
+import sys
 import time
+from typing import Any
+import httpx
 from dotenv import load_dotenv
 from web3 import Web3
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 
 # Load environment variables
 load_dotenv()
@@ -39,67 +43,148 @@ ETH_PER_ACCOUNT = Web3.to_wei(0.001, "ether")
 # faucet() function selector (no arguments)
 FAUCET_SELECTOR = "0xde5f72fd"
 
+# Fields shared by every faucet() call; only from/nonce/gasPrice vary per tx
+FAUCET_TX_TEMPLATE = {
+    "to": USDC_ADDRESS,
+    "data": FAUCET_SELECTOR,
+    "gas": 100_000,
+    "chainId": CHAIN_ID,
+}
 
-def generate_accounts(num_accounts: int) -> list[tuple[str, str]]:
+# How often to check for a new block while waiting for confirmations
+BLOCK_POLL_SECONDS = 0.5
+
+# Requests per JSON-RPC batch (public RPCs cap batch sizes)
+RPC_BATCH_SIZE = 50
+
+# Gas price changes per block (~2s on Base); reuse a fetched value this long
+GAS_PRICE_TTL_SECONDS = 5.0
+
+# (fetched_at, gas_price) from the last eth_gasPrice call
+_gas_price_cache: tuple[float, int] = (0.0, 0)
+
+# HTTP client shared by every batched JSON-RPC call (created on first use)
+_rpc_http: httpx.Client | None = None
+
+
+def generate_accounts(num_accounts: int) -> list[LocalAccount]:
     """Generate new Ethereum accounts.
 
-    Returns list of (address, private_key) tuples.
+    Returns the LocalAccount objects so they can sign without re-deriving keys.
     """
-    accounts = []
-    for i in range(num_accounts):
-        account = Account.create()
-        accounts.append((account.address, account.key.hex()))
-    return accounts
+    return [Account.create() for _ in range(num_accounts)]
+
+
+def get_gas_price(w3: Web3) -> int:
+    """Return the current gas price, refetching at most every GAS_PRICE_TTL_SECONDS."""
+    global _gas_price_cache
+    fetched_at, gas_price = _gas_price_cache
+    now = time.monotonic()
+    if not gas_price or now - fetched_at >= GAS_PRICE_TTL_SECONDS:
+        gas_price = w3.eth.gas_price
+        _gas_price_cache = (now, gas_price)
+    return gas_price
 
 
-def send_eth(w3: Web3, from_account, to_address: str, amount: int, nonce: int) -> str:
-    """Send ETH from one account to another."""
+def sign_eth_transfer(from_account, to_address: str, amount: int, nonce: int, gas_price: int) -> bytes:
+    """Sign an ETH transfer and return the raw transaction."""
     tx = {
         "from": from_account.address,
         "to": to_address,
         "value": amount,
         "gas": 21000,
-        "gasPrice": w3.eth.gas_price,
+        "gasPrice": gas_price,
         "nonce": nonce,
         "chainId": CHAIN_ID,
     }
+    return from_account.sign_transaction(tx).raw_transaction
 
-    signed = from_account.sign_transaction(tx)
-    tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-    return tx_hash.hex()
 
+def sign_faucet_call(account, nonce: int, gas_price: int) -> bytes:
+    """Sign a call to the faucet() function on MockUSDC and return the raw transaction."""
+    tx = {**FAUCET_TX_TEMPLATE, "from": account.address, "nonce": nonce, "gasPrice": gas_price}
+    return account.sign_transaction(tx).raw_transaction
 
-def call_faucet(w3: Web3, account, usdc_address: str) -> str:
-    """Call the faucet() function on MockUSDC."""
-    nonce = w3.eth.get_transaction_count(account.address)
 
-    tx = {
-        "from": account.address,
-        "to": usdc_address,
-        "data": FAUCET_SELECTOR,
-        "gas": 100000,
-        "gasPrice": w3.eth.gas_price,
-        "nonce": nonce,
-        "chainId": CHAIN_ID,
-    }
+def rpc_batch(method: str, params_list: list[list]) -> list[Any]:
+    """Call one JSON-RPC method for many parameter sets using batched requests.
 
-    signed = account.sign_transaction(tx)
-    tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-    return tx_hash.hex()
+    Sends RPC_BATCH_SIZE calls per HTTP round trip over one shared client.
+    Returns each call's result (or an Exception describing its failure), in
+    input order.
+    """
+    global _rpc_http
+    if _rpc_http is None:
+        _rpc_http = httpx.Client(timeout=30.0)
+
+    results: list[Any] = []
+    for start in range(0, len(params_list), RPC_BATCH_SIZE):
+        chunk = params_list[start:start + RPC_BATCH_SIZE]
+        payload = [
+            {"jsonrpc": "2.0", "id": start + j, "method": method, "params": params}
+            for j, params in enumerate(chunk)
+        ]
+        try:
+            response = _rpc_http.post(RPC_URL, json=payload)
+            response.raise_for_status()
+            by_id = {item["id"]: item for item in response.json()}
+        except Exception as e:
+            results.extend(e for _ in chunk)
+            continue
+
+        for j in range(len(chunk)):
+            item = by_id.get(start + j)
+            if item is None:
+                results.append(RuntimeError("no response in RPC batch"))
+            elif "error" in item:
+                results.append(RuntimeError(item["error"].get("message", item["error"])))
+            else:
+                results.append(item["result"])
+    return results
 
 
-def wait_for_tx(w3: Web3, tx_hash: str, timeout: int = 60) -> bool:
-    """Wait for a transaction to be mined."""
-    start = time.time()
-    while time.time() - start < timeout:
+def broadcast_all(raw_txs: list[bytes]) -> list[str | Exception]:
+    """Broadcast signed transactions in batched eth_sendRawTransaction requests.
+
+    Returns a tx hash (or the failure) per transaction, in input order.
+    """
+    return rpc_batch("eth_sendRawTransaction", [[Web3.to_hex(raw_tx)] for raw_tx in raw_txs])
+
+
+def wait_for_all(w3: Web3, tx_hashes: list[str], timeout: int = 60) -> list[bool]:
+    """Wait for several transactions to be mined. Returns success per tx, in input order.
+
+    Polls eth_blockNumber and, only when a new block appears, fetches every
+    still-pending receipt in batched eth_getTransactionReceipt requests.
+    """
+    confirmed = [False] * len(tx_hashes)
+    pending = dict(enumerate(tx_hashes))
+    deadline = time.time() + timeout
+    last_block = None
+    while pending and time.time() < deadline:
         try:
-            receipt = w3.eth.get_transaction_receipt(tx_hash)
-            if receipt:
-                return receipt["status"] == 1
+            block = w3.eth.block_number
         except Exception:
-            pass
-        time.sleep(1)
-    return False
+            block = last_block
+        if block != last_block:
+            last_block = block
+            indexes = list(pending)
+            receipts = rpc_batch("eth_getTransactionReceipt", [[pending[i]] for i in indexes])
+            for i, receipt in zip(indexes, receipts):
+                # None while still pending; Exception if the lookup failed (retried next block)
+                if isinstance(receipt, dict):
+                    confirmed[i] = int(receipt["status"], 16) == 1
+                    del pending[i]
+        if pending:
+            time.sleep(BLOCK_POLL_SECONDS)
+    return confirmed
+
+
+def emit(lines: list[str]) -> None:
+    """Write a phase's per-account output lines in a single stdout write."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def main():
@@ -161,9 +246,11 @@ def main():
     print("\n" + "=" * 70)
     print("GENERATED ACCOUNTS")
     print("=" * 70)
-    for i, (address, private_key) in enumerate(accounts):
-        print(f"[{i+1}] {address}")
-        print(f"    Key: {private_key}")
+    emit([
+        line
+        for i, account in enumerate(accounts)
+        for line in (f"[{i+1}] {account.address}", f"    Key: {account.key.hex()}")
+    ])
 
     # Send ETH to each account
     print("\n" + "=" * 70)
@@ -171,21 +258,35 @@ def main():
     print("=" * 70)
 
     funder_nonce = w3.eth.get_transaction_count(funder.address)
-    eth_tx_hashes = []
-
-    for i, (address, _) in enumerate(accounts):
-        tx_hash = send_eth(w3, funder, address, eth_per_account, funder_nonce + i)
-        eth_tx_hashes.append(tx_hash)
-        print(f"[{i+1}] Sent {args.eth_amount} ETH to {address[:10]}... tx: {tx_hash[:10]}...")
+    gas_price = get_gas_price(w3)
+
+    # Sign every transfer up front, then broadcast them in batched JSON-RPC requests
+    raw_txs = [
+        sign_eth_transfer(funder, account.address, eth_per_account, funder_nonce + i, gas_price)
+        for i, account in enumerate(accounts)
+    ]
+    eth_tx_hashes = broadcast_all(raw_txs)
+    lines = []
+    for i, (account, tx_hash) in enumerate(zip(accounts, eth_tx_hashes)):
+        address = account.address
+        if isinstance(tx_hash, Exception):
+            lines.append(f"[{i+1}] Failed to send ETH to {address[:10]}...: {tx_hash}")
+        else:
+            lines.append(f"[{i+1}] Sent {args.eth_amount} ETH to {address[:10]}... tx: {tx_hash[:10]}...")
+    emit(lines)
 
     # Wait for ETH transfers to confirm
     print("\nWaiting for ETH transfers to confirm...")
-    for i, tx_hash in enumerate(eth_tx_hashes):
-        success = wait_for_tx(w3, tx_hash)
+    sent = [(i, tx_hash) for i, tx_hash in enumerate(eth_tx_hashes) if not isinstance(tx_hash, Exception)]
+    confirmed = dict(zip((i for i, _ in sent), wait_for_all(w3, [tx_hash for _, tx_hash in sent])))
+    lines = []
+    for i in range(len(accounts)):
+        success = confirmed.get(i, False)
         status = "OK" if success else "FAILED"
-        print(f"[{i+1}] {status}")
+        lines.append(f"[{i+1}] {status}")
         if not success:
-            print(f"    Warning: ETH transfer may have failed")
+            lines.append(f"    Warning: ETH transfer may have failed")
+    emit(lines)
 
     # Call faucet for each account
     if not args.skip_faucet:
@@ -193,33 +294,49 @@ def main():
         print("CALLING USDC FAUCET FOR EACH ACCOUNT")
         print("=" * 70)
 
-        faucet_tx_hashes = []
-        for i, (address, private_key) in enumerate(accounts):
-            account = Account.from_key(private_key)
+        gas_price = get_gas_price(w3)
+        # Freshly generated accounts have never sent a transaction, so each
+        # one's single faucet call uses nonce 0 without fetching it
+
+        faucet_raw_txs: list[tuple[int, bytes]] = []
+        faucet_tx_hashes: list[tuple[int, str | None]] = []
+        lines = []
+        for i, account in enumerate(accounts):
             try:
-                tx_hash = call_faucet(w3, account, USDC_ADDRESS)
-                faucet_tx_hashes.append((i, tx_hash))
-                print(f"[{i+1}] Faucet called for {address[:10]}... tx: {tx_hash[:10]}...")
+                faucet_raw_txs.append((i, sign_faucet_call(account, 0, gas_price)))
             except Exception as e:
-                print(f"[{i+1}] Failed to call faucet: {e}")
+                lines.append(f"[{i+1}] Failed to call faucet: {e}")
                 faucet_tx_hashes.append((i, None))
 
+        # Submit all faucet calls in batched JSON-RPC requests
+        results = broadcast_all([raw_tx for _, raw_tx in faucet_raw_txs])
+        for (i, _), tx_hash in zip(faucet_raw_txs, results):
+            address = accounts[i].address
+            if isinstance(tx_hash, Exception):
+                lines.append(f"[{i+1}] Failed to call faucet: {tx_hash}")
+                faucet_tx_hashes.append((i, None))
+            else:
+                lines.append(f"[{i+1}] Faucet called for {address[:10]}... tx: {tx_hash[:10]}...")
+                faucet_tx_hashes.append((i, tx_hash))
+        faucet_tx_hashes.sort()
+        emit(lines)
+
         # Wait for faucet calls to confirm
         print("\nWaiting for faucet transactions to confirm...")
-        for i, tx_hash in faucet_tx_hashes:
-            if tx_hash:
-                success = wait_for_tx(w3, tx_hash)
-                status = "OK - 10,000 USDC" if success else "FAILED"
-                print(f"[{i+1}] {status}")
-            else:
-                print(f"[{i+1}] SKIPPED")
+        pending = [(i, tx_hash) for i, tx_hash in faucet_tx_hashes if tx_hash]
+        confirmed = dict(zip((i for i, _ in pending), wait_for_all(w3, [tx_hash for _, tx_hash in pending])))
+        emit([
+            f"[{i+1}] {'OK - 10,000 USDC' if confirmed[i] else 'FAILED'}" if tx_hash else f"[{i+1}] SKIPPED"
+            for i, tx_hash in faucet_tx_hashes
+        ])
 
     # Output the environment variable
     print("\n" + "=" * 70)
     print("SETUP COMPLETE!")
     print("=" * 70)
 
-    private_keys = [pk for _, pk in accounts]
+    # Serialize keys only for output
+    private_keys = [account.key.hex() for account in accounts]
     keys_str = ",".join(private_keys)
 
     print("\nAdd this to your .env file or export it:")
@@ -237,12 +354,16 @@ def main():
         f.write(f"# Each account has {args.eth_amount} ETH and 10,000 USDC\n")
         f.write(f"TURBINE_PRIVATE_KEYS={keys_str}\n")
         f.write("\n# Individual keys for reference:\n")
-        for i, (address, private_key) in enumerate(accounts):
-            f.write(f"# Account {i+1}: {address}\n")
+        for i, (account, private_key) in enumerate(zip(accounts, private_keys)):
+            f.write(f"# Account {i+1}: {account.address}\n")
             f.write(f"# PRIVATE_KEY_{i+1}={private_key}\n")
 
     print(f"Keys also saved to: {env_file}")
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        if _rpc_http is not None:
+            _rpc_http.close()
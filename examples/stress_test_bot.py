@@ -26,13 +26,30 @@ Usage:
 import argparse
 import asyncio
 import os
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Any
+
 import aiohttp
+from dotenv import load_dotenv
+
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    # orjson is optional, stdlib json works too
+    import json
+    from json import loads as json_loads
 
-from turbine_client import TurbineClient, Outcome, QuickMarket
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+from turbine_client import Market, Outcome, QuickMarket, TurbineClient
+from turbine_client.constants import ENDPOINTS
 from turbine_client.exceptions import TurbineApiError
+from turbine_client.order_builder import OrderBuilder
 
 # Load environment variables
 load_dotenv()
@@ -48,6 +65,15 @@ DEFAULT_TRADES_PER_BATCH = 10
 DEFAULT_ORDER_SIZE = 100_000  # 0.1 shares
 DEFAULT_BATCH_DELAY = 5
 DEFAULT_NUM_BATCHES = 3
+DEFAULT_MAX_CONCURRENT = 64  # In-flight order submissions (and connections) at once
+MAX_INFLIGHT_BATCHES = 2  # Next batch may start signing while the previous one is still submitting
+
+# Public RPC endpoints used to watch relayer approval transactions
+RPC_URLS = {
+    137: "https://polygon-bor-rpc.publicnode.com",
+    43114: "https://api.avax.network/ext/bc/C/rpc",
+    84532: "https://sepolia.base.org",
+}
 
 
 def get_private_keys() -> list[str]:
@@ -86,6 +112,36 @@ def get_or_create_api_credentials(private_key: str) -> tuple[str, str]:
     return credentials["api_key_id"], credentials["api_private_key"]
 
 
+# Order builders for the current signing worker process, keyed by wallet address
+_worker_builders: dict[str, OrderBuilder] = {}
+
+
+def _init_sign_worker(builders: dict[str, OrderBuilder]) -> None:
+    """Seed a signing worker process with every account's order builder."""
+    _worker_builders.update(builders)
+
+
+def sign_order_worker(
+    address: str,
+    market_id: str,
+    outcome: Outcome,
+    price: int,
+    size: int,
+    expiration: int,
+    settlement_address: str,
+) -> bytes:
+    """Sign a limit buy in a worker process and return its serialized API payload."""
+    order = _worker_builders[address].create_limit_buy(
+        market_id=market_id,
+        outcome=outcome,
+        price=price,
+        size=size,
+        expiration=expiration,
+        settlement_address=settlement_address,
+    )
+    return json_dumps(order.to_dict())
+
+
 class StressTestBot:
     """Bot that places multiple trades simultaneously for stress testing.
 
@@ -105,24 +161,40 @@ class StressTestBot:
         order_size: int = DEFAULT_ORDER_SIZE,
         batch_delay: float = DEFAULT_BATCH_DELAY,
         num_batches: int = DEFAULT_NUM_BATCHES,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     ):
         if not clients:
             raise ValueError("At least one client is required")
         self.clients = clients
+        # Lowercased wallet addresses, precomputed for trade ownership filters
+        self._our_addresses_lc = {c.address.lower() for c in clients}
         self.trades_per_batch = trades_per_batch
         self.order_size = order_size
         self.batch_delay = batch_delay
         self.num_batches = num_batches
+        self.max_concurrent = max(1, min(trades_per_batch, max_concurrent))
+        # Bounds in-flight submissions to the connector's per-host connection limit
+        self._submit_sem = asyncio.Semaphore(self.max_concurrent)
         self.market_id: str | None = None
         self.settlement_address: str | None = None
         self.strike_price: int = 0
+        self._markets_by_id: dict[str, Market] = {}
         self.total_orders_placed = 0
         self.total_orders_succeeded = 0
         self.total_orders_failed = 0
 
-        # Shared aiohttp session for parallel requests
+        # Process pool that signs orders on all cores, open for the whole run()
+        self._sign_pool: ProcessPoolExecutor | None = None
+
+        # Shared aiohttp session for parallel requests, open for the whole run()
+        # so connections are reused across batches
         self._session: aiohttp.ClientSession | None = None
 
+        # Web3 per chain for approval receipt polling, over one pooled requests
+        # session; created lazily by _get_w3 since web3 is only needed then
+        self._rpc_session: Any = None
+        self._w3_by_chain: dict[int, Any] = {}
+
     @property
     def client(self) -> TurbineClient:
         """Primary client (for market queries and general operations)."""
@@ -135,66 +207,67 @@ class StressTestBot:
     async def get_active_market(self) -> tuple[str, int, int, str] | None:
         """Get the currently active BTC quick market."""
         try:
-            response = self.client._http.get("/api/v1/quick-markets/BTC")
+            response = await asyncio.to_thread(self.client._http.get, "/api/v1/quick-markets/BTC")
             quick_market_data = response.get("quickMarket")
             if not quick_market_data:
                 return None
             quick_market = QuickMarket.from_dict(quick_market_data)
 
-            # Get settlement address from markets list
-            markets = self.client.get_markets()
-            settlement_address = None
-            for market in markets:
-                if market.id == quick_market.market_id:
-                    settlement_address = market.settlement_address
-                    break
+            # Get settlement address from the markets list (refetched only if this market is new)
+            market = self._markets_by_id.get(quick_market.market_id)
+            if market is None:
+                markets = await asyncio.to_thread(self.client.get_markets)
+                self._markets_by_id = {m.id: m for m in markets}
+                market = self._markets_by_id.get(quick_market.market_id)
+            settlement_address = market.settlement_address if market else None
 
             return quick_market.market_id, quick_market.end_time, quick_market.start_price, settlement_address
         except Exception as e:
             print(f"Failed to get active market: {e}")
             return None
 
-    def prepare_order(
+    async def prepare_order(
         self,
         client: TurbineClient,
         outcome: Outcome,
         price: int,
-    ) -> tuple[dict, dict]:
+        expiration: int,
+    ) -> tuple[bytes, dict]:
         """Prepare an order for async submission.
 
-        Creates and signs the order using the sync client, then returns
-        the payload and headers needed for async HTTP submission.
+        Signs and JSON-encodes the order in the signing process pool, then
+        returns the body and headers needed for async HTTP submission.
         No per-order permit — relies on one-time max permit allowance.
 
         Returns:
-            Tuple of (order_payload, headers) for async submission.
+            Tuple of (order_body, headers) for async submission.
         """
-        # Create and sign order (CPU-bound, done synchronously)
-        order = client.create_limit_buy(
-            market_id=self.market_id,
-            outcome=outcome,
-            price=price,
-            size=self.order_size,
-            expiration=int(time.time()) + 300,
-            settlement_address=self.settlement_address,
+        # Sign and serialize order in a worker process (CPU-bound EIP-712 signing)
+        loop = asyncio.get_running_loop()
+        payload = await loop.run_in_executor(
+            self._sign_pool,
+            sign_order_worker,
+            client.address,
+            self.market_id,
+            outcome,
+            price,
+            self.order_size,
+            expiration,
+            self.settlement_address,
         )
 
         # No per-order permit — using one-time max permit allowance
 
-        # Get the payload and auth headers
-        payload = order.to_dict()
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        headers.update(client._http._auth.get_auth_header())
+        # Only the auth header is per order (fresh nonce each time); static
+        # headers are set once on the shared session
+        headers = client._http._auth.get_auth_header()
 
         return payload, headers
 
     async def submit_order_async(
         self,
         session: aiohttp.ClientSession,
-        payload: dict,
+        payload: bytes,
         headers: dict,
         order_num: int,
         account_addr: str,
@@ -214,21 +287,25 @@ class StressTestBot:
             "error": None,
             "order_hash": None,
             "status": None,
+            "sent_at": None,
         }
 
         url = f"{TURBINE_HOST}/api/v1/orders"
 
         try:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status >= 400:
-                    error_body = await response.json()
-                    error_msg = error_body.get("error", error_body.get("message", str(error_body)))
-                    result["error"] = error_msg
-                else:
-                    response_data = await response.json()
-                    result["success"] = True
-                    result["order_hash"] = response_data.get("orderHash")
-                    result["status"] = response_data.get("status", "unknown")
+            async with self._submit_sem:
+                # Timestamped once a slot is free, just before the request goes out
+                result["sent_at"] = time.time()
+                async with session.post(url, data=payload, headers=headers) as response:
+                    if response.status >= 400:
+                        error_body = json_loads(await response.read())
+                        error_msg = error_body.get("error", error_body.get("message", str(error_body)))
+                        result["error"] = error_msg
+                    else:
+                        response_data = json_loads(await response.read())
+                        result["success"] = True
+                        result["order_hash"] = response_data.get("orderHash")
+                        result["status"] = response_data.get("status", "unknown")
 
         except aiohttp.ClientError as e:
             result["error"] = f"HTTP error: {e}"
@@ -240,64 +317,98 @@ class StressTestBot:
     # Half of max uint256 — threshold for "already has max approval"
     MAX_APPROVAL_THRESHOLD = (2**256 - 1) // 2
 
-    def ensure_all_approved(self) -> None:
+    # How long to wait for a relayer approval tx to be mined
+    APPROVAL_TIMEOUT_SECONDS = 30
+
+    async def ensure_all_approved(self) -> None:
         """Ensure all clients have gasless max USDC approval for the settlement contract.
 
         Signs a one-time max permit per client via the relayer. No native gas required.
+        All clients are approved concurrently.
         """
         print(f"\n{'='*60}")
         print("ENSURING GASLESS USDC APPROVALS")
         print(f"{'='*60}")
 
-        for i, client in enumerate(self.clients):
-            print(f"\n[{i+1}/{len(self.clients)}] {client.address}")
+        try:
+            results = await asyncio.gather(*(
+                self._ensure_approved(i, client)
+                for i, client in enumerate(self.clients)
+            ))
+        finally:
+            if self._rpc_session is not None:
+                self._rpc_session.close()
+                self._rpc_session = None
+                self._w3_by_chain.clear()
+        # Each client's lines are printed together so concurrent approvals don't interleave
+        for lines in results:
+            print("\n" + "\n".join(lines))
+
+        print(f"\n{'='*60}")
+        print("APPROVAL SETUP COMPLETE")
+        print(f"{'='*60}")
+
+    def _get_w3(self, chain_id: int):
+        """Get the shared Web3 for a chain, creating it over a pooled session on first use."""
+        w3 = self._w3_by_chain.get(chain_id)
+        if w3 is None:
+            from requests import Session
+            from requests.adapters import HTTPAdapter
+            from web3 import Web3
+
+            if self._rpc_session is None:
+                self._rpc_session = Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+                self._rpc_session.mount("http://", adapter)
+                self._rpc_session.mount("https://", adapter)
+            w3 = Web3(Web3.HTTPProvider(RPC_URLS.get(chain_id), session=self._rpc_session))
+            self._w3_by_chain[chain_id] = w3
+        return w3
+
+    async def _ensure_approved(self, i: int, client: TurbineClient) -> list[str]:
+        """Approve one client and return its status lines."""
+        lines = [f"[{i+1}/{len(self.clients)}] {client.address}"]
 
+        try:
             # Check current allowance
-            current_allowance = client.get_usdc_allowance(spender=self.settlement_address)
+            current_allowance = await asyncio.to_thread(
+                client.get_usdc_allowance, spender=self.settlement_address
+            )
 
             if current_allowance >= self.MAX_APPROVAL_THRESHOLD:
-                print(f"  ✓ Already has max approval")
-                continue
+                lines.append(f"  ✓ Already has max approval")
+                return lines
 
             # Submit gasless max permit via relayer
-            print(f"  Submitting gasless max permit...")
-            try:
-                result = client.approve_usdc_for_settlement(self.settlement_address)
-                tx_hash = result.get("tx_hash", "unknown")
-                print(f"  Relayer TX: {tx_hash}")
-                print(f"  Waiting for confirmation...")
-
-                # Wait for transaction confirmation
-                from web3 import Web3
-                rpc_urls = {
-                    137: "https://polygon-bor-rpc.publicnode.com",
-                    43114: "https://api.avax.network/ext/bc/C/rpc",
-                    84532: "https://sepolia.base.org",
-                }
-                rpc_url = rpc_urls.get(client.chain_id)
-                w3 = Web3(Web3.HTTPProvider(rpc_url))
-
-                for _ in range(30):
-                    try:
-                        receipt = w3.eth.get_transaction_receipt(tx_hash)
-                        if receipt:
-                            if receipt["status"] == 1:
-                                print(f"  ✓ Max approval confirmed (gasless)")
-                            else:
-                                print(f"  ✗ Transaction failed")
-                            break
-                    except Exception:
-                        pass
-                    time.sleep(1)
-                else:
-                    print(f"  ⚠ Transaction pending (may still confirm)")
+            lines.append(f"  Submitting gasless max permit...")
+            result = await asyncio.to_thread(client.approve_usdc_for_settlement, self.settlement_address)
+            tx_hash = result.get("tx_hash", "unknown")
+            lines.append(f"  Relayer TX: {tx_hash}")
+            w3 = self._get_w3(client.chain_id)
+
+            # Wait for transaction confirmation, polling with exponential backoff (0.2s up to 2s)
+            deadline = time.monotonic() + self.APPROVAL_TIMEOUT_SECONDS
+            attempt = 0
+            while time.monotonic() < deadline:
+                try:
+                    receipt = await asyncio.to_thread(w3.eth.get_transaction_receipt, tx_hash)
+                    if receipt:
+                        if receipt["status"] == 1:
+                            lines.append(f"  ✓ Max approval confirmed (gasless)")
+                        else:
+                            lines.append(f"  ✗ Transaction failed")
+                        break
+                except Exception:
+                    pass
+                await asyncio.sleep(min(2.0, 0.2 * 1.5 ** attempt))
+                attempt += 1
+            else:
+                lines.append(f"  ⚠ Transaction pending (may still confirm)")
 
-            except Exception as e:
-                print(f"  ✗ Gasless approval failed: {e}")
+        except Exception as e:
+            lines.append(f"  ✗ Gasless approval failed: {e}")
 
-        print(f"\n{'='*60}")
-        print("APPROVAL SETUP COMPLETE")
-        print(f"{'='*60}")
+        return lines
 
     async def place_batch_orders(self, batch_num: int) -> list[dict]:
         """Place a batch of orders with TRUE parallel HTTP requests."""
@@ -309,8 +420,10 @@ class StressTestBot:
 
         # Get current orderbook to determine prices
         try:
-            yes_orderbook = self.client.get_orderbook(self.market_id, outcome=Outcome.YES)
-            no_orderbook = self.client.get_orderbook(self.market_id, outcome=Outcome.NO)
+            yes_orderbook, no_orderbook = await asyncio.gather(
+                asyncio.to_thread(self.client.get_orderbook, self.market_id, outcome=Outcome.YES),
+                asyncio.to_thread(self.client.get_orderbook, self.market_id, outcome=Outcome.NO),
+            )
         except Exception as e:
             print(f"Failed to get orderbook: {e}")
             return []
@@ -334,93 +447,108 @@ class StressTestBot:
             trades_per_account[addr] = trades_per_account.get(addr, 0) + 1
         print(f"Trades per account: {trades_per_account}")
 
-        # PHASE 1: Prepare all orders synchronously (CPU-bound: signing)
-        print(f"\nPreparing {self.trades_per_batch} orders...")
-        prep_start = time.time()
-
-        prepared_orders = []
-        for i in range(self.trades_per_batch):
-            client = self.get_client_for_trade(i)
-
-            if i % 2 == 0:
-                outcome = Outcome.YES
-                price = yes_price + (i * 1000)
-            else:
-                outcome = Outcome.NO
-                price = no_price + (i * 1000)
-
-            price = min(price, 990000)
-
-            payload, headers = self.prepare_order(client, outcome, price)
-            prepared_orders.append({
-                "payload": payload,
-                "headers": headers,
-                "order_num": i + 1,
-                "account": client.address,
-                "outcome": outcome.name,
-                "price": price,
-            })
-
-        prep_elapsed = time.time() - prep_start
-        print(f"Orders prepared in {prep_elapsed:.2f}s")
-
-        # PHASE 2: Submit all orders in TRUE PARALLEL using aiohttp
-        print(f"Submitting {self.trades_per_batch} orders in parallel...")
-        submit_start = time.time()
-
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self.submit_order_async(
-                    session,
-                    order["payload"],
-                    order["headers"],
-                    order["order_num"],
-                    order["account"],
-                    order["outcome"],
-                    order["price"],
-                )
-                for order in prepared_orders
-            ]
-            results = await asyncio.gather(*tasks)
-
-        submit_elapsed = time.time() - submit_start
-        print(f"All {self.trades_per_batch} orders submitted in {submit_elapsed:.3f}s (avg {submit_elapsed/self.trades_per_batch*1000:.1f}ms/order)")
+        # Build order specs (cheap), then sign and submit each order as a pipeline:
+        # an order's POST goes out as soon as its own signature is ready instead of
+        # waiting for the whole batch to finish signing
+        # Even orders buy YES, odd orders buy NO, each stepping the price up by 0.1%
+        sides = ((Outcome.YES, yes_price), (Outcome.NO, no_price))
+        clients = self.clients
+        orders = [
+            (clients[i % len(clients)], i + 1, sides[i & 1][0], min(sides[i & 1][1] + i * 1000, 990000))
+            for i in range(self.trades_per_batch)
+        ]
+
+        print(f"\nSigning and submitting {self.trades_per_batch} orders (pipelined)...")
+        batch_start = time.time()
+        # Every order in the batch shares one expiration
+        expiration = int(batch_start) + 300
+
+        async def sign_and_submit(client: TurbineClient, order_num: int, outcome: Outcome, price: int) -> dict:
+            try:
+                payload, headers = await self.prepare_order(client, outcome, price, expiration)
+            except Exception as e:  # e.g. BrokenProcessPool from the signing workers
+                return {
+                    "order_num": order_num,
+                    "outcome": outcome.name,
+                    "price": price,
+                    "account": client.address[:10],
+                    "success": False,
+                    "error": f"Signing failed: {e}",
+                    "order_hash": None,
+                    "status": None,
+                    "sent_at": None,
+                }
+            return await self.submit_order_async(
+                self._session,
+                payload,
+                headers,
+                order_num,
+                client.address,
+                outcome.name,
+                price,
+            )
+
+        results = await asyncio.gather(*(sign_and_submit(*order) for order in orders))
+
+        batch_elapsed = time.time() - batch_start
+        sent_at = [r["sent_at"] for r in results if r["sent_at"] is not None]
+        print(f"First order submitted after {min(sent_at) - batch_start:.3f}s" if sent_at else "No orders submitted")
+        print(f"All {self.trades_per_batch} orders signed and submitted in {batch_elapsed:.3f}s (avg {batch_elapsed/self.trades_per_batch*1000:.1f}ms/order)")
 
         # Summarize results
         succeeded = sum(1 for r in results if r["success"])
-        failed = sum(1 for r in results if not r["success"])
+        failed = len(results) - succeeded
 
         self.total_orders_placed += self.trades_per_batch
         self.total_orders_succeeded += succeeded
         self.total_orders_failed += failed
 
-        print(f"\nBatch {batch_num} Results:")
-        print(f"  Succeeded: {succeeded}/{self.trades_per_batch}")
-        print(f"  Failed: {failed}/{self.trades_per_batch}")
-
-        # Show individual results
-        for r in results:
-            status = "OK" if r["success"] else "FAIL"
-            if r["success"]:
-                print(f"  [{r['order_num']:2d}] {status} - {r['outcome']:3s} @ {r['price']/10000:.1f}% [{r['account']}] - {r['status']}")
-            else:
-                print(f"  [{r['order_num']:2d}] {status} - {r['outcome']:3s} @ {r['price']/10000:.1f}% [{r['account']}] - {r['error']}")
+        # Summary and individual results, written to stdout in one go
+        lines = [
+            f"\nBatch {batch_num} Results:",
+            f"  Succeeded: {succeeded}/{self.trades_per_batch}",
+            f"  Failed: {failed}/{self.trades_per_batch}",
+        ]
+        lines.extend(
+            f"  [{r['order_num']:2d}] OK - {r['outcome']:3s} @ {r['price']/10000:.1f}% [{r['account']}] - {r['status']}"
+            if r["success"] else
+            f"  [{r['order_num']:2d}] FAIL - {r['outcome']:3s} @ {r['price']/10000:.1f}% [{r['account']}] - {r['error']}"
+            for r in results
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
         return results
 
+    async def _warm_connections(self) -> None:
+        """Open pooled connections to the API before the first batch.
+
+        Sends concurrent health checks so DNS resolution and TLS handshakes are
+        paid here rather than inside batch 1's timed submission window.
+        """
+        url = f"{TURBINE_HOST}{ENDPOINTS['health']}"
+
+        async def ping() -> None:
+            async with self._session.get(url) as response:
+                await response.read()
+
+        await asyncio.gather(*(ping() for _ in range(self.max_concurrent)), return_exceptions=True)
+
     async def check_settlement_status(self) -> None:
         """Check the status of pending and failed trades."""
         try:
-            pending = self.client.get_pending_trades()
-            # Filter to our market and any of our accounts
-            our_addresses = {c.address.lower() for c in self.clients}
+            # Fetch both lists concurrently, then filter to our market and any of our accounts
+            pending, failed = await asyncio.gather(
+                asyncio.to_thread(self.client.get_pending_trades),
+                asyncio.to_thread(self.client.get_failed_trades),
+            )
+            market_id = self.market_id
+            our_addresses = self._our_addresses_lc
             my_pending = [t for t in pending
-                         if t.market_id == self.market_id
+                         if t.market_id == market_id
                          and t.buyer_address.lower() in our_addresses]
-
-            failed = self.client.get_failed_trades()
             my_failed = [t for t in failed
-                        if t.market_id == self.market_id
+                        if t.market_id == market_id
                         and t.buyer_address.lower() in our_addresses]
 
             print(f"\nSettlement Status:")
@@ -462,36 +590,79 @@ class StressTestBot:
         print(f"Order size: {self.order_size / 1_000_000:.2f} shares")
         print(f"Batches: {self.num_batches if self.num_batches > 0 else 'Infinite'}")
         print(f"Delay between batches: {self.batch_delay}s ({int(self.batch_delay * 1000)}ms)")
+        print(f"Max concurrent submissions: {self.max_concurrent}")
         print(f"Approval mode: GASLESS (one-time max permit)")
         print(f"HTTP mode: ASYNC (true parallel requests)")
 
         # Ensure all clients have gasless max USDC approval
-        self.ensure_all_approved()
+        await self.ensure_all_approved()
+
+        # Sign orders across all cores; each worker gets every account's order builder
+        self._sign_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_sign_worker,
+            initargs=({c.address: c._order_builder for c in self.clients},),
+        )
 
-        # Run batches
+        # Run batches over one session so TCP/TLS connections are reused
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.max_concurrent,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        timeout = aiohttp.ClientTimeout(total=30, connect=5)
         batch_num = 0
+        inflight: set[asyncio.Task] = set()
         try:
-            while self.num_batches == 0 or batch_num < self.num_batches:
-                batch_num += 1
-
-                # Check if market is about to expire
-                time_remaining = end_time - int(time.time())
-                if time_remaining < 60:
-                    print(f"\nMarket expires in {time_remaining}s - stopping test")
-                    break
-
-                await self.place_batch_orders(batch_num)
+            async with aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={"Content-Type": "application/json"},
+            ) as self._session:
+                try:
+                    await self._warm_connections()
+
+                    while self.num_batches == 0 or batch_num < self.num_batches:
+                        batch_num += 1
+
+                        # Check if market is about to expire
+                        time_remaining = end_time - int(time.time())
+                        if time_remaining < 60:
+                            print(f"\nMarket expires in {time_remaining}s - stopping test")
+                            break
 
-                # Delay before next batch
-                if self.num_batches == 0 or batch_num < self.num_batches:
-                    if self.batch_delay >= 1:
-                        print(f"\nWaiting {self.batch_delay}s before next batch...")
-                    else:
-                        print(f"\nWaiting {int(self.batch_delay * 1000)}ms before next batch...")
-                    await asyncio.sleep(self.batch_delay)
+                        # Start this batch without waiting for the previous one to drain,
+                        # up to MAX_INFLIGHT_BATCHES at a time
+                        if len(inflight) >= MAX_INFLIGHT_BATCHES:
+                            done, inflight = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+                            for task in done:
+                                task.result()  # re-raise anything the batch didn't handle
+                        inflight.add(asyncio.create_task(self.place_batch_orders(batch_num)))
+
+                        # Delay before next batch
+                        if self.num_batches == 0 or batch_num < self.num_batches:
+                            if self.batch_delay >= 1:
+                                print(f"\nWaiting {self.batch_delay}s before next batch...")
+                            else:
+                                print(f"\nWaiting {int(self.batch_delay * 1000)}ms before next batch...")
+                            await asyncio.sleep(self.batch_delay)
+
+                    # Let the last batches finish before the session closes
+                    if inflight:
+                        await asyncio.gather(*inflight)
+                finally:
+                    # Stop unfinished batches before the session and signing pool go away
+                    for task in inflight:
+                        task.cancel()
+                    await asyncio.gather(*inflight, return_exceptions=True)
 
         except KeyboardInterrupt:
             print("\n\nInterrupted by user")
+        finally:
+            self._session = None
+            self._sign_pool.shutdown()
+            self._sign_pool = None
 
         # Final summary
         print(f"\n{'='*60}")
@@ -532,6 +703,12 @@ async def main():
         default=DEFAULT_BATCH_DELAY,
         help=f"Delay in seconds between batches, supports decimals like 0.1 (default: {DEFAULT_BATCH_DELAY})"
     )
+    parser.add_argument(
+        "-c", "--max-concurrent",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT,
+        help=f"Maximum order submissions in flight at once (default: {DEFAULT_MAX_CONCURRENT})"
+    )
     args = parser.parse_args()
 
     # Get private keys (supports multiple)
@@ -566,6 +743,7 @@ async def main():
         order_size=args.size,
         batch_delay=args.delay,
         num_batches=args.batches,
+        max_concurrent=args.max_concurrent,
     )
 
     try:
@@ -576,6 +754,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass  # uvloop is optional, the stdlib event loop works too
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
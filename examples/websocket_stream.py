@@ -3,92 +3,140 @@ Example: WebSocket streaming for real-time data.
 
 This example shows how to:
 - Connect to the WebSocket server
-- Subscribe to orderbook updates
-- Subscribe to trade updates
-- Subscribe to quick market updates
+- Subscribe to a market (orderbook and trade updates share one subscription)
+- Format and print the incoming updates
 """
 
 import asyncio
+import sys
 
 from turbine_client import TurbineClient, TurbineWSClient
 from turbine_client.exceptions import WebSocketError
 
+# Stream output is buffered and flushed on this timer instead of per message
+FLUSH_INTERVAL_SECONDS = 0.01
+
+# Display scaling for the per-message formatting
+_INV_PRICE_PCT = 1e-4  # price (1e6 scale) -> percent
+_INV_SIZE = 1e-6  # size (6 decimals) -> shares
+_INV_STRIKE = 1e-8  # quick market start price -> USD
+
+
+def _on_orderbook(message) -> str | None:
+    if not message.data:
+        return None
+    # Only the top of book is shown, so skip building every price level
+    bid = message.best_bid
+    ask = message.best_ask
+    best_bid = bid.price * _INV_PRICE_PCT if bid else 0
+    best_ask = ask.price * _INV_PRICE_PCT if ask else 0
+    spread = best_ask - best_bid
+    return f"[ORDERBOOK] Bid: {best_bid:.2f}% | Ask: {best_ask:.2f}% | Spread: {spread:.2f}%"
+
+
+def _on_trade(message) -> str | None:
+    trade = getattr(message, "trade", None)
+    if not trade:
+        return None
+    side = "BUY" if trade.side == 0 else "SELL"
+    outcome = "YES" if trade.outcome == 0 else "NO"
+    return f"[TRADE] {side} {trade.size * _INV_SIZE:.2f} {outcome} @ {trade.price * _INV_PRICE_PCT:.2f}%"
+
+
+def _on_quick_market(message) -> str | None:
+    qm = getattr(message, "quick_market", None)
+    if not qm:
+        return None
+    return f"[QUICK MARKET] {qm.asset} Strike: ${qm.start_price * _INV_STRIKE:,.2f} | {'RESOLVED' if qm.resolved else 'ACTIVE'}"
+
+
+def _on_other(message) -> str:
+    # Other message types
+    return f"[{message.type.upper()}] {message.data}"
+
+
+# Formatter per message type; each returns the line to print (or None to skip)
+HANDLERS = {
+    "orderbook": _on_orderbook,
+    "trade": _on_trade,
+    "quick_market": _on_quick_market,
+}
+
+
+async def flush_periodically(out) -> None:
+    """Flush buffered stream output every FLUSH_INTERVAL_SECONDS."""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        out.flush()
+
 
 async def main():
-    # First, get a market ID using the REST API
+    # Get a market ID using the REST API while the WebSocket handshake runs
     client = TurbineClient(
         host="https://api.turbinefi.com",
         chain_id=137,
     )
-
-    markets = client.get_markets()
-    client.close()
-
-    if not markets:
-        print("No markets available")
-        return
-
-    market = markets[0]
-    print(f"Streaming data for: {market.question}")
-    print(f"Market ID: {market.id}")
-    print()
+    markets_task = asyncio.create_task(asyncio.to_thread(client.get_markets))
 
     # Create WebSocket client
     ws = TurbineWSClient(host="https://api.turbinefi.com")
 
     try:
-        async with ws.connect() as stream:
-            # Subscribe to orderbook updates
-            await stream.subscribe_orderbook(market.id)
-            print("Subscribed to orderbook updates")
-
-            # Subscribe to trade updates
-            await stream.subscribe_trades(market.id)
-            print("Subscribed to trade updates")
-
-            # Subscribe to quick markets (BTC)
-            await stream.subscribe_quick_markets("BTC")
-            print("Subscribed to BTC quick market updates")
+        async with ws.connect(decode=False) as stream:
+            markets = await markets_task
+            if not markets:
+                print("No markets available")
+                return
+
+            market = markets[0]
+            print(f"Streaming data for: {market.question}")
+            print(f"Market ID: {market.id}")
+            print()
+
+            # One market subscription delivers both orderbook and trade
+            # updates, so a single frame goes out at startup
+            await stream.subscribe(market.id)
+            print("Subscribed to orderbook and trade updates")
             print()
 
             print("Waiting for messages (Ctrl+C to stop)...")
             print("-" * 50)
-
-            # Process incoming messages
-            async for message in stream:
-                if message.type == "orderbook":
-                    if hasattr(message, "orderbook") and message.orderbook:
-                        ob = message.orderbook
-                        best_bid = ob.bids[0].price / 10000 if ob.bids else 0
-                        best_ask = ob.asks[0].price / 10000 if ob.asks else 0
-                        spread = best_ask - best_bid
-                        print(f"[ORDERBOOK] Bid: {best_bid:.2f}% | Ask: {best_ask:.2f}% | Spread: {spread:.2f}%")
-
-                elif message.type == "trade":
-                    if hasattr(message, "trade") and message.trade:
-                        trade = message.trade
-                        price_pct = trade.price / 10000
-                        shares = trade.size / 1_000_000
-                        side = "BUY" if trade.side == 0 else "SELL"
-                        outcome = "YES" if trade.outcome == 0 else "NO"
-                        print(f"[TRADE] {side} {shares:.2f} {outcome} @ {price_pct:.2f}%")
-
-                elif message.type == "quick_market":
-                    if hasattr(message, "quick_market") and message.quick_market:
-                        qm = message.quick_market
-                        price = qm.start_price / 1e8
-                        status = "RESOLVED" if qm.resolved else "ACTIVE"
-                        print(f"[QUICK MARKET] {qm.asset} Strike: ${price:,.2f} | {status}")
-
-                else:
-                    # Other message types
-                    print(f"[{message.type.upper()}] {message.data}")
+            sys.stdout.flush()
+
+            # Message lines go to a 64 KB buffered writer on stdout's file
+            # descriptor; a background task flushes it every 10 ms
+            with open(sys.stdout.fileno(), "w", buffering=65536, closefd=False) as out:
+                flusher = asyncio.create_task(flush_periodically(out))
+
+                # Process incoming messages, draining each burst in one pass
+                try:
+                    while True:
+                        lines = []
+                        for message in await stream.recv_batch(128):
+                            line = HANDLERS.get(message.type, _on_other)(message)
+                            if line:
+                                lines.append(line)
+
+                        if lines:
+                            out.write("\n".join(lines) + "\n")
+                finally:
+                    flusher.cancel()
 
     except WebSocketError as e:
         print(f"WebSocket error: {e}")
     except KeyboardInterrupt:
         print("\nDisconnected")
+    finally:
+        # Let an unfinished market fetch settle before closing its client
+        await asyncio.gather(markets_task, return_exceptions=True)
+        client.close()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass  # uvloop is optional, the stdlib event loop works too
+
     asyncio.run(main())
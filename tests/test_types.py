@@ -7,6 +7,7 @@ from turbine_client.types import (
     Order,
     OrderArgs,
     OrderBookSnapshot,
+    OrderBookUpdate,
     Outcome,
     Position,
     PriceLevel,
@@ -186,6 +187,31 @@ class TestOrderBookSnapshot:
         assert snapshot.last_update == 1735689600
 
 
+class TestOrderBookUpdate:
+    """Tests for OrderBookUpdate WebSocket message."""
+
+    def test_best_bid_ask(self, market_id):
+        """Test reading the top of book without the full snapshot."""
+        update = OrderBookUpdate(
+            type="orderbook",
+            market_id=market_id,
+            data={
+                "bids": [{"price": 490000, "size": 5000000}, {"price": 480000, "size": 1}],
+                "asks": [{"price": "510000", "size": "5000000"}],
+            },
+        )
+
+        assert update.best_bid == PriceLevel(price=490000, size=5000000)
+        assert update.best_ask == PriceLevel(price=510000, size=5000000)
+
+    def test_best_bid_ask_empty(self, market_id):
+        """Test empty or missing books have no top level."""
+        update = OrderBookUpdate(type="orderbook", market_id=market_id, data={"bids": []})
+        assert update.best_bid is None
+        assert update.best_ask is None
+        assert OrderBookUpdate(type="orderbook").best_bid is None
+
+
 class TestTrade:
     """Tests for Trade dataclass."""
 
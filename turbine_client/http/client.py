@@ -10,6 +10,10 @@ from turbine_client.auth import BearerTokenAuth
 from turbine_client.constants import HEADER_CONTENT_TYPE, HEADER_USER_AGENT, USER_AGENT
 from turbine_client.exceptions import TurbineApiError
 
+# Keep idle pooled connections alive across typical bot poll intervals (5-30s)
+# so each poll reuses the connection instead of paying a fresh TLS handshake.
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
 
 class HttpClient:
     """HTTP client for making requests to the Turbine API."""
@@ -33,6 +37,12 @@ class HttpClient:
         self._client = httpx.Client(
             http2=True,
             timeout=timeout,
+            # httpx's default pool sizes (100/20); only the keepalive expiry changes
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
             headers={
                 HEADER_USER_AGENT: USER_AGENT,
                 HEADER_CONTENT_TYPE: "application/json",
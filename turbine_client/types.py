@@ -712,6 +712,24 @@ class OrderBookUpdate(WSMessage):
             return OrderBookSnapshot.from_dict({**self.data, "marketId": self.market_id})
         return None
 
+    def _top_level(self, side: str) -> Optional[PriceLevel]:
+        """Get the first level of "bids" or "asks" from the raw message data."""
+        if self.data and isinstance(self.data, dict):
+            levels = self.data.get(side)
+            if levels:
+                return PriceLevel.from_dict(levels[0])
+        return None
+
+    @property
+    def best_bid(self) -> Optional[PriceLevel]:
+        """Get the top bid without building the full orderbook snapshot."""
+        return self._top_level("bids")
+
+    @property
+    def best_ask(self) -> Optional[PriceLevel]:
+        """Get the top ask without building the full orderbook snapshot."""
+        return self._top_level("asks")
+
 
 @dataclass
 class TradeUpdate(WSMessage):
@@ -4,8 +4,8 @@ WebSocket client for real-time Turbine market data.
 
 import asyncio
 import json
-from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, List, Optional, Set
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Callable, List, Optional, Set, Union
 
 import websockets
 from websockets.asyncio.client import ClientConnection
@@ -21,18 +21,29 @@ from turbine_client.types import (
     WSMessage,
 )
 
+# One signature for either parser; both accept str or bytes
+json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # orjson is optional, stdlib json works too
+
 
 class WSStream:
     """WebSocket stream for receiving market data."""
 
-    def __init__(self, connection: ClientConnection) -> None:
+    def __init__(self, connection: ClientConnection, decode: bool = True) -> None:
         """Initialize the stream.
 
         Args:
             connection: The WebSocket connection.
+            decode: Whether to UTF-8 decode text frames. When False, frames are
+                parsed as raw bytes, skipping the decode and its validation.
         """
         self._connection = connection
         self._subscriptions: Set[str] = set()
+        # None keeps the websockets default (text frames -> str, binary -> bytes)
+        self._decode: Optional[bool] = None if decode else False
 
     async def subscribe(self, market_id: str) -> None:
         """Subscribe to a market to receive orderbook and trade updates.
@@ -123,26 +134,29 @@ class WSStream:
         else:
             return WSMessage.from_dict(data)
 
-    def _parse_message(self, raw: str) -> List[WSMessage]:
+    def _parse_message(self, raw: Union[str, bytes]) -> List[WSMessage]:
         """Parse a raw WebSocket message (may contain multiple JSON objects).
 
         Args:
-            raw: The raw message string.
+            raw: The raw message, as text or undecoded bytes.
 
         Returns:
             A list of parsed WSMessages.
         """
         messages = []
         # Handle newline-delimited JSON (multiple objects in one message)
-        for line in raw.strip().split("\n"):
+        lines: Union[list[bytes], list[str]] = (
+            raw.strip().split(b"\n") if isinstance(raw, bytes) else raw.strip().split("\n")
+        )
+        for line in lines:
             line = line.strip()
             if not line:
                 continue
             try:
-                data = json.loads(line)
-                messages.append(self._parse_single_message(data))
-            except json.JSONDecodeError as e:
+                data = json_loads(line)
+            except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError
                 raise WebSocketError(f"Failed to parse message: {e}") from e
+            messages.append(self._parse_single_message(data))
         return messages
 
     async def __aiter__(self) -> AsyncIterator[WSMessage]:
@@ -152,9 +166,8 @@ class WSStream:
             Parsed WebSocket messages.
         """
         try:
-            async for raw_message in self._connection:
-                if isinstance(raw_message, bytes):
-                    raw_message = raw_message.decode("utf-8")
+            while True:
+                raw_message = await self._connection.recv(decode=self._decode)
                 for msg in self._parse_message(raw_message):
                     yield msg
         except websockets.exceptions.ConnectionClosed:
@@ -170,13 +183,60 @@ class WSStream:
             WebSocketError: If the connection is closed.
         """
         try:
-            raw = await self._connection.recv()
-            if isinstance(raw, bytes):
-                raw = raw.decode("utf-8")
+            raw = await self._connection.recv(decode=self._decode)
             return self._parse_message(raw)
         except websockets.exceptions.ConnectionClosed as e:
             raise WebSocketError(f"Connection closed: {e}") from e
 
+    async def _recv_ready(self) -> Optional[list[WSMessage]]:
+        """Receive one message only if it can be read without waiting.
+
+        Returns:
+            The parsed messages, or None if no complete message is buffered.
+
+        Raises:
+            WebSocketError: If the connection is closed.
+        """
+        task = asyncio.ensure_future(self._connection.recv(decode=self._decode))
+        # A zero timeout still lets the task run one step, which completes it
+        # when a whole message is already buffered
+        done, _ = await asyncio.wait({task}, timeout=0)
+        if not done:
+            # Cancelling recv() loses no data; a partly received message is
+            # returned by a later call
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            return None
+        try:
+            return self._parse_message(task.result())
+        except websockets.exceptions.ConnectionClosed as e:
+            raise WebSocketError(f"Connection closed: {e}") from e
+
+    async def recv_batch(self, max_messages: int = 128) -> list[WSMessage]:
+        """Receive every message that is immediately available.
+
+        Waits for the next message, then drains messages that have already
+        arrived without waiting again, so a burst of updates is handled in
+        one call instead of one resumption per message.
+
+        Args:
+            max_messages: Stop draining once this many messages are collected.
+
+        Returns:
+            A list of at least one message.
+
+        Raises:
+            WebSocketError: If the connection is closed.
+        """
+        messages = await self.recv()
+        while len(messages) < max_messages:
+            ready = await self._recv_ready()
+            if ready is None:
+                break
+            messages.extend(ready)
+        return messages
+
     async def close(self) -> None:
         """Close the stream."""
         await self._connection.close()
@@ -218,9 +278,13 @@ class TurbineWSClient:
         return f"{self._host}{WS_ENDPOINT}"
 
     @asynccontextmanager
-    async def connect(self) -> AsyncIterator[WSStream]:
+    async def connect(self, decode: bool = True) -> AsyncIterator[WSStream]:
         """Connect to the WebSocket server.
 
+        Args:
+            decode: Whether to UTF-8 decode text frames. Pass False to parse
+                frames as raw bytes and skip the decode for trusted JSON feeds.
+
         Yields:
             A WSStream for sending/receiving messages.
 
@@ -235,16 +299,19 @@ class TurbineWSClient:
         """
         try:
             self._connection = await websockets.connect(self.url)
-            stream = WSStream(self._connection)
+            stream = WSStream(self._connection, decode=decode)
             yield stream
         finally:
             if self._connection:
                 await self._connection.close()
                 self._connection = None
 
-    async def connect_with_retry(self) -> WSStream:
+    async def connect_with_retry(self, decode: bool = True) -> WSStream:
         """Connect with automatic reconnection.
 
+        Args:
+            decode: Whether to UTF-8 decode text frames (see connect()).
+
         Returns:
             A WSStream for sending/receiving messages.
 
@@ -257,7 +324,7 @@ class TurbineWSClient:
         while True:
             try:
                 self._connection = await websockets.connect(self.url)
-                return WSStream(self._connection)
+                return WSStream(self._connection, decode=decode)
             except Exception as e:
                 if not self._reconnect:
                     raise WebSocketError(f"Connection failed: {e}") from e